@@ -1,28 +1,1566 @@
 """
 script for updating the version of a maven project based on git commits
+"""
+# only the modules needed to classify commit messages are imported here,
+# GitPython, ElementTree and the modules for pools, asyncio and the daemon 
+# are imported by the functions using them, so a commit-msg hook or a 
+# classification only caller doesn't pay for them
+# regex for analyzing commit messages
+import re
+# accessing working directory, exit code
+import os
+import sys
+# storing the scan cache on disk
+import json
+# patching the pom.xml in place
+import mmap
+# timing the pipeline stages
+import time
+# opening repo and pom on first use, caching parsed versions
+from functools import cached_property, lru_cache, partial
+# results of the batch mode, warm repositories of the daemon
+from collections import namedtuple, OrderedDict
+# integer columns of many versions, sorted prerelease ranks
+from array import array
+from bisect import bisect_left
+
+def _logger():
+    """returns the logger of the script, logging is only imported when 
+    something is logged
+
+    Returns:
+        logging.Logger: logger named "semver"
+    """
+    import logging
+    return logging.getLogger("semver")
+
+class Instrumentation:
+    """
+    collects timings and counters of the version bump pipeline
+    
+    Set an Instrumentation object on SemanticVersioning.instrumentation to 
+    enable it. With the default None no stage is measured and no callback 
+    is called. Timings are summed up per stage, so they don't grow with the 
+    number of commits.
+    
+    Stages: "history", "classify", "pom_parse", "pom_write"
+    Counters: "commits_scanned", "matches_found", "bytes_parsed"
+    """
+    def __init__(self, callback=None, profile=False):
+        """
+        Args:
+            callback (Callable, optional): called as callback(kind, name, 
+            value) for every finished stage ("span", name, seconds) and 
+            counter update ("count", name, value). Defaults to None.
+            profile (bool, optional): run cProfile while a stage is 
+            measured. Defaults to False.
+        """
+        self.callback = callback
+        # name -> {"calls": int, "seconds": float}
+        self.timings = {}
+        # name -> int
+        self.counters = {}
+        self.profiler = None
+        if(profile):
+            import cProfile
+            self.profiler = cProfile.Profile()
+        # number of open spans, the profiler only runs once
+        self._depth = 0
+    
+    def span(self, name):
+        """returns a context manager measuring a stage
+
+        Args:
+            name (string): name of the stage
+
+        Returns:
+            _Span: context manager for the with statement
+        """
+        return _Span(self, name)
+    
+    def count(self, name, value=1):
+        """increases a counter
+
+        Args:
+            name (string): name of the counter
+            value (int, optional): amount added. Defaults to 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+        if(self.callback is not None):
+            self.callback("count", name, value)
+    
+    def _record(self, name, seconds):
+        """
+        adds the duration of a finished stage
+        """
+        timing = self.timings.setdefault(name, {"calls": 0, "seconds": 0.0})
+        timing["calls"] += 1
+        timing["seconds"] += seconds
+        if(self.callback is not None):
+            self.callback("span", name, seconds)
+    
+    def to_dict(self):
+        """
+        returns timings and counters as a dict, that can be dumped as JSON
+        """
+        return {"timings": self.timings, "counters": self.counters}
+    
+    def export_json(self, path):
+        """writes timings and counters to a JSON file
+
+        Args:
+            path (string): path of the JSON file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+    
+    def dump_profile(self, path):
+        """writes the cProfile data of all stages, it can be read with 
+        pstats or tools like snakeviz
+
+        Args:
+            path (string): path of the profile
+
+        Raises:
+            ValueError: if the object wasn't created with profile=True
+        """
+        if(self.profiler is None):
+            raise ValueError("Instrumentation was created without profile")
+        self.profiler.dump_stats(path)
+
+class _Span:
+    """
+    context manager measuring a single stage of an Instrumentation
+    """
+    __slots__ = ("instrumentation", "name", "start")
+    
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.start = None
+    
+    def __enter__(self):
+        instrumentation = self.instrumentation
+        if(instrumentation.profiler is not None 
+           and instrumentation._depth == 0):
+            instrumentation.profiler.enable()
+        instrumentation._depth += 1
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        instrumentation = self.instrumentation
+        instrumentation._depth -= 1
+        if(instrumentation.profiler is not None 
+           and instrumentation._depth == 0):
+            instrumentation.profiler.disable()
+        instrumentation._record(self.name, seconds)
+        return False
+
+class _NoSpan:
+    """
+    context manager doing nothing, used while instrumentation is disabled
+    """
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+class MissingKeywordException(Exception):
+    """
+    raised when no keyword is found in the commit messages
+    """
+    pass
+
+# tokens of a xml document, everything but tags is skipped by the scanner
+POM_TOKEN = re.compile(
+    rb"<!--.*?-->"                          # comment
+    rb"|<!\[CDATA\[.*?\]\]>"                # cdata section
+    rb"|<[?!][^>]*>"                        # declaration, doctype
+    rb"|<(/?)([^\s/>]+)"                    # start or end tag and its name
+    rb"(?:\"[^\"]*\"|'[^']*'|[^>\"'])*>",   # attributes until the >
+    re.DOTALL)
+
+def iter_pom_elements(data):
+    """scans a pom.xml and yields the text content location of every element 
+    without child elements, the document is never parsed into a tree
+
+    Args:
+        data (bytes, mmap): content of the pom.xml
+
+    Yields:
+        Tuple(Tuple(String), int, int, int): path of local element names from 
+        the root, start and end offset of the text content and the content 
+        start of the parent element, which identifies elements of the same 
+        parent, e.g. groupId, artifactId and version of one dependency
+    """
+    path = [] # names of the open elements
+    starts = [] # content start offset of the open elements
+    leaf = False # True, if the innermost open element has no children yet
+    for token in POM_TOKEN.finditer(data):
+        name = token.group(2)
+        if(name is None):
+            # comments, cdata and declarations don't change the structure
+            continue
+        # strip namespace prefixes like "pom:version"
+        name = name.rpartition(b":")[2].decode("utf-8")
+        if(token.group(1)):
+            # end tag of the innermost open element
+            if(leaf):
+                parent = starts[-2] if len(starts) > 1 else 0
+                yield tuple(path), starts[-1], token.start(), parent
+            path.pop()
+            starts.pop()
+            leaf = False
+        elif(token.group(0).endswith(b"/>")):
+            # self closing element, it has no content to patch
+            leaf = False
+        else:
+            path.append(name)
+            starts.append(token.end())
+            leaf = True
+
+def find_pom_version(data):
+    """finds the location of the project version in a pom.xml
+
+    Args:
+        data (bytes, mmap): content of the pom.xml
+
+    Returns:
+        Tuple(int, int): start and end offset of the version text, None if 
+        the project has no version of its own
+    """
+    for path, start, end, parent in iter_pom_elements(data):
+        if(path == ("project", "version")):
+            return start, end
+    return None
+
+def write_pom_version(pom_path, new_version):
+    """replaces only the bytes of the project version in a pom.xml, every 
+    other byte of the file stays untouched
+
+    Args:
+        pom_path (string): path of the pom.xml
+        new_version (string): version written to the pom
+
+    Raises:
+        ValueError: if the pom has no project version
+    """
+    # escape the few chars, that are not allowed in xml text
+    new_text = (new_version or "").replace("&", "&amp;").replace(
+        "<", "&lt;").replace(">", "&gt;").encode("utf-8")
+    with open(pom_path, "r+b") as file:
+        with mmap.mmap(file.fileno(), 0) as data:
+            span = find_pom_version(data)
+            if(span is None):
+                raise ValueError(f"No project version found in {pom_path}")
+            start, end = span
+            if(end - start == len(new_text)):
+                # same length -> patch the mapped bytes directly
+                data[start:end] = new_text
+                return
+            tail = data[end:]
+        # the length changed -> rewrite everything after the version
+        file.seek(start)
+        file.write(new_text + tail)
+        file.truncate()
+
+def read_pom_info(pom_path):
+    """reads the coordinates, the parent and the modules of a pom.xml
+
+    Args:
+        pom_path (string): path of the pom.xml
+
+    Returns:
+        Dict: "path", "groupId", "artifactId", "version", "parent" (Dict of 
+        the parent coordinates) and "modules" (List(String)), groupId and 
+        version are inherited from the parent if the pom doesn't set them
+    """
+    with open(pom_path, "rb") as file:
+        data = file.read()
+    info = {"path": pom_path, "groupId": None, "artifactId": None, 
+            "version": None, "parent": {}, "modules": []}
+    for path, start, end, parent in iter_pom_elements(data):
+        text = data[start:end].decode("utf-8").strip()
+        if(len(path) == 2 and path[1] in info):
+            info[path[1]] = text
+        elif(len(path) == 3 and path[1] == "parent"):
+            info["parent"][path[2]] = text
+        elif(path == ("project", "modules", "module")):
+            info["modules"].append(text)
+    # like maven, take missing coordinates from the parent
+    if(info["groupId"] is None):
+        info["groupId"] = info["parent"].get("groupId")
+    if(info["version"] is None):
+        info["version"] = info["parent"].get("version")
+    return info
+
+def discover_reactor_poms(root_pom, executor):
+    """finds the poms of all modules of a multi module project, every level 
+    of modules is read in parallel
+
+    Args:
+        root_pom (string): path of the aggregator pom.xml
+        executor (Executor): pool the poms are read on
+
+    Returns:
+        List(Dict): infos of all poms as returned by read_pom_info, the root 
+        pom comes first
+    """
+    infos = []
+    pending = [os.path.normpath(root_pom)]
+    seen = set(pending)
+    while(pending):
+        level = list(executor.map(read_pom_info, pending))
+        infos += level
+        pending = []
+        for info in level:
+            directory = os.path.dirname(info["path"])
+            for module in info["modules"]:
+                # a module is a directory or the path of a pom file
+                module_path = os.path.normpath(os.path.join(directory, module))
+                if(os.path.isdir(module_path)):
+                    module_path = os.path.join(module_path, "pom.xml")
+                if(module_path not in seen):
+                    seen.add(module_path)
+                    pending.append(module_path)
+    return infos
+
+def rewrite_reactor_pom(pom_path, members, old_version, new_version):
+    """updates the versions of one module pom, that belong to the reactor:
+    its own version, the parent version and the versions of dependencies 
+    and plugins on other modules, everything else stays untouched
+
+    Args:
+        pom_path (string): path of the pom.xml
+        members (Set(Tuple(String, String))): groupId and artifactId of all 
+        modules using the reactor version
+        old_version (string): version of the reactor before the update
+        new_version (string): version the reactor is updated to
+
+    Returns:
+        bool: True if the pom was changed
+    """
+    with open(pom_path, "rb") as file:
+        data = file.read()
+    spans = [] # (start, end) of every version to replace
+    # groupId, artifactId and version of the parent and every dependency
+    references = {}
+    for path, start, end, parent in iter_pom_elements(data):
+        if(path == ("project", "version")):
+            if(data[start:end].decode("utf-8").strip() == old_version):
+                spans.append((start, end))
+        elif(len(path) >= 2 and path[-2] in ("parent", "dependency", 
+                                            "plugin")):
+            reference = references.setdefault(parent, {})
+            reference[path[-1]] = (
+                data[start:end].decode("utf-8").strip(), start, end)
+    for reference in references.values():
+        if("version" not in reference or "artifactId" not in reference):
+            continue
+        version, start, end = reference["version"]
+        group = reference.get("groupId", (None,))[0]
+        # properties like ${project.version} resolve on their own
+        if((group, reference["artifactId"][0]) in members 
+           and version == old_version):
+            spans.append((start, end))
+    if(not spans):
+        return False
+    # splice the new version into the spans and write the file once
+    new_text = new_version.encode("utf-8")
+    parts = []
+    position = 0
+    for start, end in sorted(spans):
+        parts += [data[position:start], new_text]
+        position = end
+    parts.append(data[position:])
+    with open(pom_path, "wb") as file:
+        file.write(b"".join(parts))
+    return True
+
+def update_reactor_versions(root_pom, new_version, workers=None):
+    """updates the version of a multi module project consistently: the root 
+    version, the version of every module using the same version, parent 
+    references and dependencies between the modules
+    reading and rewriting the poms runs on a thread pool
+
+    Args:
+        root_pom (string): path of the aggregator pom.xml
+        new_version (string): version the reactor is updated to
+        workers (int, optional): number of threads. Defaults to None 
+        (chosen by ThreadPoolExecutor).
+
+    Returns:
+        List(String): paths of all changed poms
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(workers) as executor:
+        infos = discover_reactor_poms(root_pom, executor)
+        old_version = infos[0]["version"]
+        # modules released together with the root
+        members = {(info["groupId"], info["artifactId"]) for info in infos 
+                   if info["version"] == old_version}
+        changed = executor.map(
+            lambda info: rewrite_reactor_pom(
+                info["path"], members, old_version, new_version), 
+            infos)
+        return [info["path"] for info, was_changed in zip(infos, changed) 
+                if was_changed]
+
+def copy_artifact(source, destination):
+    """copies a file inside the kernel with copy_file_range, the data is 
+    never read into python, falls back to shutil (sendfile) on systems or 
+    file systems without it
+
+    Args:
+        source (string): path of the file
+        destination (string): path of the copy
+    """
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while(remaining > 0):
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), 
+                                            remaining)
+                if(copied == 0):
+                    break
+                remaining -= copied
+        return
+    except (AttributeError, OSError):
+        # no copy_file_range, e.g. macOS, Windows or across some mounts
+        pass
+    import shutil
+    shutil.copyfile(source, destination)
+
+def sha256_file(path):
+    """computes the SHA-256 checksum of a file through a memory map, 
+    hashlib releases the GIL, so several files are hashed in parallel
+
+    Args:
+        path (string): path of the file
+
+    Returns:
+        string: hex digest of the checksum
+    """
+    import hashlib
+    with open(path, "rb") as file:
+        if(os.fstat(file.fileno()).st_size == 0):
+            # empty files can't be mapped
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.sha256(data).hexdigest()
+
+def package_release(project_dir, version, release_dir=None, 
+                    extensions=(".jar", ".zip"), workers=None):
+    """collects the built artifacts of a version from target/ into a 
+    release folder with their checksums in a manifest.json
+    copying and hashing runs on a thread pool
+
+    Args:
+        project_dir (string): directory of the maven project
+        version (string): version of the artifacts, e.g. 1.2.0
+        release_dir (string, optional): folder of all releases. Defaults to 
+        None (release/ in the project directory).
+        extensions (Tuple(String), optional): file types collected. Defaults 
+        to (".jar", ".zip").
+        workers (int, optional): number of threads. Defaults to None 
+        (chosen by ThreadPoolExecutor).
+
+    Returns:
+        Dict: the manifest, version and name, size and sha256 of every 
+        artifact
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    target = os.path.join(project_dir, "target")
+    if(release_dir is None):
+        release_dir = os.path.join(project_dir, "release")
+    destination = os.path.join(release_dir, version)
+    os.makedirs(destination, exist_ok=True)
+    # e.g. app-1.2.0.jar, app-1.2.0-sources.jar, app-1.2.0-dist.zip
+    names = sorted(entry.name for entry in os.scandir(target) 
+                   if entry.is_file() and entry.name.endswith(extensions) 
+                   and f"-{version}" in entry.name)
+    
+    def package(name):
+        source = os.path.join(target, name)
+        copy_artifact(source, os.path.join(destination, name))
+        return {"name": name, "size": os.path.getsize(source), 
+                "sha256": sha256_file(source)}
+    
+    with ThreadPoolExecutor(workers) as executor:
+        artifacts = list(executor.map(package, names))
+    manifest = {"version": version, "artifacts": artifacts}
+    with open(os.path.join(destination, "manifest.json"), "w", 
+              encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
+
+def iter_log_records(stream, chunk_size=65536):
+    """parses the output of git log --format=%H%x00%B%x00 incrementally
+
+    Args:
+        stream (BinaryIO): output stream of git log
+        chunk_size (int, optional): number of bytes read at once. 
+        Defaults to 65536.
+
+    Yields:
+        Tuple(String, String): hexsha and message of a commit
+    """
+    buffer = bytearray()
+    sha = None # sha of the record currently parsed
+    while(True):
+        chunk = stream.read(chunk_size)
+        if(not chunk):
+            break
+        buffer += chunk
+        start = 0
+        # handle every complete field in the buffer
+        while(True):
+            end = buffer.find(b"\0", start)
+            if(end < 0):
+                break
+            field = bytes(buffer[start:end])
+            start = end + 1
+            if(sha is None):
+                # git log puts a newline between the records
+                sha = field.strip().decode("ascii")
+            else:
+                yield sha, field.decode("utf-8", "replace")
+                sha = None
+        # keep only the incomplete field
+        del buffer[:start]
+
+# version as defined by https://semver.org/
+VERSION_PATTERN = re.compile(
+    r"(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)"
+    # prerelease, e.g. -SNAPSHOT, -rc.1
+    r"(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*)"
+    r"(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    # build metadata, e.g. +build.5
+    r"(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?")
+
+class Version:
+    """
+    immutable version number following https://semver.org/
+    
+    Versions are ordered by semver precedence, build metadata is ignored 
+    for ordering, equality and hashing. Use Version.parse to create a 
+    version from a string, parsed strings are cached.
+    """
+    __slots__ = ("major", "minor", "patch", "prerelease", "build", "_key")
+    
+    def __init__(self, major, minor, patch, prerelease=None, build=None):
+        """
+        Args:
+            major (int): major version number
+            minor (int): minor version number
+            patch (int): patch version number
+            prerelease (string, optional): dot separated prerelease 
+            identifiers, e.g. "rc.1". Defaults to None.
+            build (string, optional): dot separated build metadata. 
+            Defaults to None.
+        """
+        set_field = object.__setattr__
+        set_field(self, "major", major)
+        set_field(self, "minor", minor)
+        set_field(self, "patch", patch)
+        set_field(self, "prerelease", prerelease)
+        set_field(self, "build", build)
+        set_field(self, "_key", 
+                  (major, minor, patch, _prerelease_key(prerelease)))
+    
+    @staticmethod
+    def parse(version):
+        """creates a version from a string, the results are cached
+
+        Args:
+            version (string): version string, e.g. "1.2.3-rc.1+build.5"
+
+        Raises:
+            ValueError: if the string doesn't fit the SemVer Specifications
+
+        Returns:
+            Version: the parsed version
+        """
+        return _parse_version(version)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Version is immutable")
+    
+    def __reduce__(self):
+        # pickle through __init__, e.g. for process pools
+        return (Version, (self.major, self.minor, self.patch, 
+                          self.prerelease, self.build))
+    
+    def __str__(self):
+        version = f"{self.major}.{self.minor}.{self.patch}"
+        if(self.prerelease is not None):
+            version += f"-{self.prerelease}"
+        if(self.build is not None):
+            version += f"+{self.build}"
+        return version
+    
+    def __repr__(self):
+        return f"Version('{self}')"
+    
+    def __hash__(self):
+        return hash(self._key)
+    
+    def __eq__(self, other):
+        if(not isinstance(other, Version)):
+            return NotImplemented
+        return self._key == other._key
+    
+    def __lt__(self, other):
+        if(not isinstance(other, Version)):
+            return NotImplemented
+        return self._key < other._key
+    
+    def __le__(self, other):
+        if(not isinstance(other, Version)):
+            return NotImplemented
+        return self._key <= other._key
+    
+    def __gt__(self, other):
+        if(not isinstance(other, Version)):
+            return NotImplemented
+        return self._key > other._key
+    
+    def __ge__(self, other):
+        if(not isinstance(other, Version)):
+            return NotImplemented
+        return self._key >= other._key
+    
+    def bump_major(self):
+        """
+        returns the next major release, e.g. 1.2.3 -> 2.0.0
+        """
+        return Version(self.major + 1, 0, 0)
+    
+    def bump_minor(self):
+        """
+        returns the next minor release, e.g. 1.2.3 -> 1.3.0
+        """
+        return Version(self.major, self.minor + 1, 0)
+    
+    def bump_patch(self):
+        """
+        returns the next patch release, e.g. 1.2.3 -> 1.2.4
+        """
+        return Version(self.major, self.minor, self.patch + 1)
+    
+    def finalize(self):
+        """
+        returns the release of a prerelease, e.g. 1.2.3-SNAPSHOT -> 1.2.3
+        """
+        return Version(self.major, self.minor, self.patch)
+
+def _prerelease_key(prerelease):
+    """returns the semver precedence key of a prerelease
+
+    Args:
+        prerelease (string): dot separated prerelease identifiers, None for 
+        a release
+
+    Returns:
+        Tuple: key, that orders prereleases by precedence
+    """
+    # a release ranks above all of its prereleases
+    if(prerelease is None):
+        return (1,)
+    # numeric identifiers rank below alphanumeric ones
+    return (0,) + tuple(
+        (0, int(identifier), "") if identifier.isdigit() 
+        else (1, 0, identifier) 
+        for identifier in prerelease.split("."))
+
+@lru_cache(maxsize=4096)
+def _parse_version(version):
+    """parses a version string, use Version.parse instead
+
+    Args:
+        version (string): version string
+
+    Raises:
+        ValueError: if the string doesn't fit the SemVer Specifications
+
+    Returns:
+        Version: the parsed version
+    """
+    match = VERSION_PATTERN.fullmatch(version)
+    if(match is None):
+        raise ValueError(f"Version must fit the SemVer Specifications: "
+                         f"{version!r}")
+    major, minor, patch, prerelease, build = match.groups()
+    return Version(int(major), int(minor), int(patch), prerelease, build)
+
+def _load_numpy():
+    """
+    returns the numpy module, None if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class VersionArray:
+    """
+    column based collection of versions for bulk operations
+    
+    major, minor and patch are stored in separate integer arrays and every 
+    prerelease is replaced by its rank, so sorting and comparing never 
+    touches a string. NumPy is used if it is installed (optional), otherwise 
+    the columns are stored in the array module.
+    """
+    def __init__(self, majors, minors, patches, prereleases, builds, 
+                 numpy=None):
+        """
+        Args:
+            majors (Iterable(int)): major version numbers
+            minors (Iterable(int)): minor version numbers
+            patches (Iterable(int)): patch version numbers
+            prereleases (List(String)): prerelease of every version or None
+            builds (List(String)): build metadata of every version or None
+            numpy (module, optional): numpy module used for the columns. 
+            Defaults to None (array module).
+        """
+        self.numpy = numpy
+        self.prereleases = prereleases
+        self.builds = builds
+        # every distinct prerelease gets an odd rank by precedence, so a 
+        # prerelease, that isn't part of the array, can use the even ranks 
+        # in between
+        self._prerelease_keys = sorted(
+            {_prerelease_key(prerelease) for prerelease in prereleases})
+        ranks = {key: 2 * index + 1 
+                 for index, key in enumerate(self._prerelease_keys)}
+        self.majors = self._column(majors)
+        self.minors = self._column(minors)
+        self.patches = self._column(patches)
+        self.ranks = self._column(
+            ranks[_prerelease_key(prerelease)] for prerelease in prereleases)
+    
+    @classmethod
+    def parse(cls, versions, use_numpy=None):
+        """parses many version strings at once
+
+        Args:
+            versions (Iterable(String)): version strings
+            use_numpy (bool, optional): True to require numpy, False to never 
+            use it. Defaults to None (numpy is used if it is installed).
+
+        Raises:
+            ValueError: if a string doesn't fit the SemVer Specifications
+            ImportError: if numpy is required, but not installed
+
+        Returns:
+            VersionArray: the parsed versions
+        """
+        numpy = _load_numpy() if use_numpy is not False else None
+        if(use_numpy and numpy is None):
+            raise ImportError("numpy is required for use_numpy=True")
+        majors, minors, patches, prereleases, builds = [], [], [], [], []
+        fullmatch = VERSION_PATTERN.fullmatch
+        for version in versions:
+            # no Version object is created per string
+            match = fullmatch(version)
+            if(match is None):
+                raise ValueError(f"Version must fit the SemVer "
+                                 f"Specifications: {version!r}")
+            major, minor, patch, prerelease, build = match.groups()
+            majors.append(int(major))
+            minors.append(int(minor))
+            patches.append(int(patch))
+            prereleases.append(prerelease)
+            builds.append(build)
+        return cls(majors, minors, patches, prereleases, builds, numpy)
+    
+    def _column(self, values):
+        """creates an integer column for the active backend
+
+        Args:
+            values (Iterable(int)): values of the column
+
+        Returns:
+            numpy.ndarray, array.array: the column
+        """
+        if(self.numpy is not None):
+            return self.numpy.fromiter(values, dtype=self.numpy.int64)
+        return array("q", values)
+    
+    def __len__(self):
+        return len(self.prereleases)
+    
+    def __getitem__(self, index):
+        return Version(int(self.majors[index]), int(self.minors[index]), 
+                       int(self.patches[index]), self.prereleases[index], 
+                       self.builds[index])
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def to_strings(self):
+        """
+        returns all versions as strings
+        """
+        return [str(version) for version in self]
+    
+    def take(self, indices):
+        """returns the versions at the given positions, the integer columns 
+        and the prerelease ranks are copied, nothing is parsed or ranked 
+        again
+
+        Args:
+            indices (Iterable(int)): positions of the versions
+
+        Returns:
+            VersionArray: the selected versions
+        """
+        numpy = self.numpy
+        if(numpy is not None):
+            if(not isinstance(indices, numpy.ndarray)):
+                indices = numpy.fromiter(indices, dtype=numpy.intp)
+            # fancy indexing, no python object per version
+            columns = [column[indices] for column in (
+                self.majors, self.minors, self.patches, self.ranks)]
+            indices = indices.tolist()
+        else:
+            indices = list(indices)
+            columns = [array("q", [column[index] for index in indices]) 
+                       for column in (self.majors, self.minors, 
+                                      self.patches, self.ranks)]
+        result = VersionArray.__new__(VersionArray)
+        result.numpy = numpy
+        result.prereleases = [self.prereleases[index] for index in indices]
+        result.builds = [self.builds[index] for index in indices]
+        # the ranks stay comparable, if some prereleases are missing
+        result._prerelease_keys = self._prerelease_keys
+        result.majors, result.minors, result.patches, result.ranks = columns
+        return result
+    
+    def argsort(self):
+        """
+        returns the positions of the versions ordered by semver precedence
+        """
+        if(self.numpy is not None):
+            # the last key is the primary one
+            return self.numpy.lexsort(
+                (self.ranks, self.patches, self.minors, self.majors))
+        columns = (self.majors, self.minors, self.patches, self.ranks)
+        return sorted(range(len(self)), key=lambda index: tuple(
+            column[index] for column in columns))
+    
+    def sort(self):
+        """
+        returns the versions ordered by semver precedence
+        """
+        return self.take(self.argsort())
+    
+    def max(self):
+        """returns the highest version
+
+        Raises:
+            ValueError: if the array is empty
+
+        Returns:
+            Version: the version with the highest precedence
+        """
+        if(len(self) == 0):
+            raise ValueError("max() of an empty VersionArray")
+        columns = (self.majors, self.minors, self.patches, self.ranks)
+        if(self.numpy is not None):
+            # lexicographic argmax, every column narrows the candidates
+            candidates = self.numpy.arange(len(self))
+            for column in columns:
+                values = column[candidates]
+                candidates = candidates[values == values.max()]
+            # the last of equal versions, like the stable sort
+            return self[int(candidates[-1])]
+        return self[max(reversed(range(len(self))), key=lambda index: tuple(
+            column[index] for column in columns))]
+    
+    def _rank_of(self, version):
+        """returns the rank a version's prerelease would have in this array
+
+        Args:
+            version (Version): any version
+
+        Returns:
+            int: rank comparable with self.ranks
+        """
+        key = _prerelease_key(version.prerelease)
+        position = bisect_left(self._prerelease_keys, key)
+        if(position < len(self._prerelease_keys) 
+           and self._prerelease_keys[position] == key):
+            return 2 * position + 1
+        # between the ranks of its neighbours
+        return 2 * position
+    
+    def _at_least(self, version):
+        """compares every version with a single one
+
+        Args:
+            version (Version): version to compare with
+
+        Returns:
+            numpy.ndarray, List(bool): True for every version >= version
+        """
+        bound = (version.major, version.minor, version.patch, 
+                 self._rank_of(version))
+        if(self.numpy is not None):
+            # lexicographic comparison of the columns, least significant 
+            # column first
+            result = self.ranks >= bound[3]
+            for column, value in ((self.patches, bound[2]), 
+                                  (self.minors, bound[1]), 
+                                  (self.majors, bound[0])):
+                result = (column > value) | ((column == value) & result)
+            return result
+        return [(major, minor, patch, rank) >= bound 
+                for major, minor, patch, rank in zip(
+                    self.majors, self.minors, self.patches, self.ranks)]
+    
+    def filter_range(self, lower=None, upper=None):
+        """returns the versions in the range lower <= version < upper
+
+        Args:
+            lower (Version, string, optional): lowest version included. 
+            Defaults to None (no lower bound).
+            upper (Version, string, optional): first version excluded. 
+            Defaults to None (no upper bound).
+
+        Returns:
+            VersionArray: versions inside the range
+        """
+        mask = None
+        if(lower is not None):
+            if(isinstance(lower, str)):
+                lower = Version.parse(lower)
+            mask = self._at_least(lower)
+        if(upper is not None):
+            if(isinstance(upper, str)):
+                upper = Version.parse(upper)
+            below = self._at_least(upper)
+            if(self.numpy is not None):
+                below = ~below
+            else:
+                below = [not at_least for at_least in below]
+            if(mask is None):
+                mask = below
+            elif(self.numpy is not None):
+                mask = mask & below
+            else:
+                mask = [both and other for both, other in zip(mask, below)]
+        if(mask is None):
+            return self
+        if(self.numpy is not None):
+            return self.take(self.numpy.flatnonzero(mask))
+        return self.take(index for index, keep in enumerate(mask) if keep)
+    
+    def bump(self, level):
+        """bumps every version, prereleases and build metadata are dropped
+
+        Args:
+            level (string): "major", "minor" or "patch"
+
+        Raises:
+            ValueError: if the level is unknown
+
+        Returns:
+            VersionArray: the bumped versions
+        """
+        count = len(self)
+        majors, minors, patches = self.majors, self.minors, self.patches
+        if(self.numpy is not None):
+            # vectorized, no python int is created per version
+            zeros = self.numpy.zeros(count, dtype=self.numpy.int64)
+            increment = lambda column: column + 1
+        else:
+            zeros = array("q", bytes(8 * count))
+            increment = lambda column: array(
+                "q", (value + 1 for value in column))
+        match(level):
+            case "major":
+                columns = (increment(majors), zeros, zeros)
+            case "minor":
+                columns = (majors, increment(minors), zeros)
+            case "patch":
+                columns = (majors, minors, increment(patches))
+            case _:
+                raise ValueError(f"Unknown level: {level}")
+        return VersionArray(*columns, [None] * count, [None] * count, 
+                            self.numpy)
+
+# the keyword regex backtracks over the rest of the line after every "(", 
+# so lines like "fix(fix(fix(..." take quadratic time. Above this estimate 
+# of the work (parentheses times the longest line) the streaming scan is 
+# faster, below it the regex is (about 5 times on usual messages)
+BACKTRACK_LIMIT = 1 << 18
+
+def needs_stream_scan(message):
+    """checks whether a message has to be classified by the streaming scan 
+    instead of the regex, see BACKTRACK_LIMIT
+
+    Args:
+        message (string): commit message
+
+    Returns:
+        bool: True if the regex could take quadratic time
+    """
+    parentheses = message.count("(")
+    # cheap upper bound first, the lines are only split for long messages
+    if(parentheses * len(message) <= BACKTRACK_LIMIT):
+        return False
+    longest = max(len(line) for line in message.splitlines())
+    return parentheses * longest > BACKTRACK_LIMIT
+
+def iter_slices(text, size=65536):
+    """yields consecutive slices of a string
+
+    Args:
+        text (string): the string
+        size (int, optional): length of a slice. Defaults to 65536.
+
+    Yields:
+        String: a single slice
+    """
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+class KeywordClassifier:
+    """
+    finds the keywords used to increase the version number in commit 
+    messages, the pattern is compiled once and reused for every message
+    """
+    def __init__(self, major, minor, patch, aliases=None, 
+                 conventional=False):
+        """
+        all keywords are compiled into a single pattern, so more aliases 
+        don't add a pass over the messages
+
+        Args:
+            major (string): keyword for a major release
+            minor (string): keyword for a minor release
+            patch (string): keyword for a patch release
+            aliases (Dict(String, String), optional): further keywords and 
+            the version type they stand for, e.g. {"feat": "minor"}. 
+            Defaults to None.
+            conventional (bool, optional): accept Conventional Commits, the 
+            type starts a line, the scope is optional and "!" or a 
+            "BREAKING CHANGE:" footer trigger a major release. Defaults to 
+            False.
+        """
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        aliases = dict(aliases or {})
+        self.conventional = conventional
+        # keywords the classifier was built with, used to detect changes
+        self.keywords = self.signature(major, minor, patch, aliases, 
+                                       conventional)
+        # rank of every version type, a higher rank outranks the lower ones
+        self.ranks = {patch: 1, minor: 2, major: 3}
+        # version type of every keyword, aliases map to the main keywords
+        self.levels = {**aliases, patch: patch, minor: minor, major: major}
+        # re.escape for the possibility to use special chars like 
+        # '+' in the keyword, longer keywords first (fixup before fix)
+        keywords = (r"(" + r"|".join(
+            re.escape(keyword) 
+            for keyword in sorted(self.levels, key=len, reverse=True)) 
+            + r")")
+        if(conventional):
+            # the type starts the line, otherwise every "word:" would count
+            self.pattern = re.compile(
+                r"(?m:^)" + keywords + r"(?:\(.+\))?(!)?:.+"
+                r"|(?m:^BREAKING[ -]CHANGE:.+)")
+            self.entry_pattern = re.compile(
+                r"(?m:^)" + keywords + r"(?:\((.+?)\))?(!)?:\s*(.+)")
+        else:
+            self.pattern = re.compile(keywords + r"\(.+\):.+")
+            # same keywords, but keeps scope and text for the release notes
+            # the empty group stands for the missing "!" marker
+            self.entry_pattern = re.compile(
+                keywords + r"\((.+?)\)():\s*(.+)")
+        # events of the streaming scan, without any repetition, so every 
+        # position is only looked at once: keywords followed by "(" (or 
+        # ":" and "!:" for Conventional Commits) and closing "):"
+        # the leading set of first characters lets re skip other positions 
+        # quickly
+        first = "".join(sorted({keyword[0] for keyword in self.levels} 
+                               | {")", "B"}))
+        if(conventional):
+            self.event_pattern = re.compile(
+                r"(?=[" + re.escape(first) + r"])(?:" 
+                + keywords + r"(?=(\()|(!?):[^\n])|\)(!?):(?=[^\n])"
+                r"|BREAKING[ -]CHANGE:(?=[^\n]))")
+        else:
+            self.event_pattern = re.compile(
+                r"(?=[" + re.escape(first) + r"])(?:" 
+                + keywords + r"(?=(\())|\)()():(?=[^\n]))")
+        # characters kept between two chunks, the longest event plus the 
+        # character looked ahead
+        self.window = max(map(len, self.levels)) + len("BREAKING CHANGE:x")
+    
+    @staticmethod
+    def signature(major, minor, patch, aliases=None, conventional=False):
+        """returns the keywords of a classifier as tuple of strings, 
+        classifiers with the same signature classify the same way
+
+        Returns:
+            Tuple(String): main keywords, aliases ("alias=type") and 
+            "conventional" if Conventional Commits are accepted
+        """
+        signature = (major, minor, patch) + tuple(sorted(
+            f"{alias}={version_type}" 
+            for alias, version_type in (aliases or {}).items()))
+        if(conventional):
+            signature += ("conventional",)
+        return signature
+    
+    def iter_version_types(self, messages):
+        """yields the keyword of every match in the messages
+
+        Args:
+            messages (Iterable(String)): commit messages
+
+        Yields:
+            String: version type of a single match
+        """
+        finditer = self.pattern.finditer
+        levels = self.levels
+        if(not self.conventional):
+            for message in messages:
+                if(needs_stream_scan(message)):
+                    yield from self.iter_stream_types(iter_slices(message))
+                    continue
+                for match in finditer(message):
+                    yield levels[match.group(1)]
+            return
+        major = self.major
+        for message in messages:
+            if(needs_stream_scan(message)):
+                yield from self.iter_stream_types(iter_slices(message))
+                continue
+            for match in finditer(message):
+                keyword, breaking = match.group(1, 2)
+                # "keyword!:" or a BREAKING CHANGE footer
+                if(keyword is None or breaking):
+                    yield major
+                else:
+                    yield levels[keyword]
+    
+    def iter_stream_types(self, chunks):
+        """yields the version types of a single message read in chunks, 
+        like iter_version_types, but only a few characters are kept between 
+        the chunks and the time is linear in the length of the message
+        the chunks are only read until a major keyword is found, if the 
+        caller stops there (e.g. highest)
+
+        Args:
+            chunks (Iterable(String)): consecutive parts of the message
+
+        Yields:
+            String: version type of a single match (at most one per line)
+        """
+        levels = self.levels
+        major = self.major
+        conventional = self.conventional
+        finditer = self.event_pattern.finditer
+        window = self.window
+        buffer = ""
+        offset = 0 # position of the buffer in the message
+        checked = 0 # end of the part of the buffer checked for line breaks
+        line_start = 0 # position of the current line
+        # state of the current line, at most one match per line:
+        decided = False # the version type of the line is known
+        scoped = None # keyword of the first "keyword(" of the line
+        close_from = 0 # first position of a ")" closing its scope
+        closed = None # "!" or "" of the last ")" closing the scope
+        fallback = None # first "keyword:" after the scope was opened
+        
+        def pending():
+            # version type of the line, if it ends now
+            if(scoped is not None and closed is not None):
+                return major if closed else levels[scoped]
+            return fallback
+        
+        chunks = iter(chunks)
+        while(True):
+            chunk = next(chunks, None)
+            buffer += chunk or ""
+            # events near the end may continue in the next chunk
+            limit = len(buffer) if chunk is None else len(buffer) - window
+            position = 0
+            for match in finditer(buffer):
+                start = match.start()
+                if(start >= limit):
+                    break
+                # line breaks are only searched between the events
+                newline = buffer.rfind("\n", checked, start)
+                if(newline != -1):
+                    if(not decided and pending() is not None):
+                        yield pending()
+                    decided = False
+                    scoped = closed = fallback = None
+                    line_start = offset + newline + 1
+                checked = position = match.end()
+                if(decided):
+                    continue
+                keyword, paren, bang, close_bang = match.groups()
+                if(conventional and keyword is not None 
+                   and offset + start != line_start):
+                    # Conventional Commits start the line with the type
+                    continue
+                if(keyword is not None and paren is not None):
+                    if(scoped is None):
+                        scoped = keyword
+                        # the scope holds at least one character
+                        close_from = offset + position + 2
+                elif(close_bang is not None):
+                    if(scoped is not None and offset + start >= close_from):
+                        if(not conventional):
+                            # the first closing ")" is enough
+                            decided = True
+                            yield levels[scoped]
+                        else:
+                            # ".+" is greedy, the last one counts
+                            closed = close_bang
+                else:
+                    # "keyword:", "keyword!:" or a BREAKING CHANGE footer
+                    if(keyword is None):
+                        if(offset + start != line_start):
+                            continue
+                        version_type = major
+                    else:
+                        version_type = major if bang else levels[keyword]
+                    if(scoped is None):
+                        decided = True
+                        yield version_type
+                    elif(fallback is None):
+                        fallback = version_type
+            # keep only the part not scanned yet
+            keep = max(position, limit)
+            newline = buffer.rfind("\n", checked, keep)
+            if(newline != -1):
+                if(not decided and pending() is not None):
+                    yield pending()
+                decided = False
+                scoped = closed = fallback = None
+                line_start = offset + newline + 1
+            if(chunk is None):
+                break
+            buffer = buffer[keep:]
+            offset += keep
+            checked = 0
+        if(not decided and pending() is not None):
+            yield pending()
+    
+    def iter_entries(self, messages):
+        """yields keyword, scope and text of every match in the messages
+
+        Args:
+            messages (Iterable(String)): commit messages
+
+        Yields:
+            Tuple(String, String, String): version type, scope and text, 
+            e.g. ("fix", "parser", "handle empty poms"), the scope is None 
+            for Conventional Commits without scope
+        """
+        finditer = self.entry_pattern.finditer
+        levels = self.levels
+        for message in messages:
+            for match in finditer(message):
+                keyword, scope, breaking, text = match.groups()
+                yield (self.major if breaking else levels[keyword], scope, 
+                       text)
+    
+    def highest(self, messages):
+        """returns the highest version type used in the messages
+        stops as soon as a major keyword is found, nothing can outrank it
+
+        Args:
+            messages (Iterable(String)): commit messages
+
+        Returns:
+            string: the highest version type, None if no keyword was used
+        """
+        return self.highest_of(self.iter_version_types(messages))
+    
+    def highest_of(self, version_types):
+        """returns the highest of already extracted version types in a 
+        single pass
+
+        Args:
+            version_types (Iterable(String)): version types
+
+        Returns:
+            string: the highest version type, None if the list holds no 
+            known version type
+        """
+        ranks = self.ranks
+        highest = None
+        highest_rank = 0
+        for version_type in version_types:
+            rank = ranks.get(version_type, 0)
+            if(rank > highest_rank):
+                highest = version_type
+                highest_rank = rank
+                # a major release can not be outranked
+                if(version_type == self.major):
+                    break
+        return highest
+    
+    def classify(self, message):
+        """returns the highest version type of a single message
+
+        Args:
+            message (string): commit message
+
+        Returns:
+            string: the highest version type, None if no keyword was used
+        """
+        return self.highest((message,))
+    
+    def count(self, messages):
+        """classifies every message and counts the messages per version type
+
+        Args:
+            messages (Iterable(String)): commit messages
+
+        Returns:
+            Dict(String, int): number of messages per version type, messages 
+            without a keyword are counted under None
+        """
+        counts = {self.major: 0, self.minor: 0, self.patch: 0, None: 0}
+        classify = self.classify
+        for message in messages:
+            counts[classify(message)] += 1
+        return counts
+
+class Changelog:
+    """
+    release notes of a single release, grouped by version type and scope
+    
+    The notes are appended to the changelog file, so older releases are 
+    never read or rewritten. Markdown files list the releases oldest first, 
+    JSON files hold one entry per line.
+    """
+    def __init__(self, classifier, titles=None):
+        """
+        Args:
+            classifier (KeywordClassifier): classifier extracting the entries
+            titles (Dict(String, String), optional): headline per version 
+            type. Defaults to None (Breaking Changes, Features, Fixes).
+        """
+        self.classifier = classifier
+        if(titles is None):
+            titles = {classifier.major: "Breaking Changes", 
+                      classifier.minor: "Features", 
+                      classifier.patch: "Fixes"}
+        self.titles = titles
+        # version type -> scope -> texts, in the order they were read
+        self.entries = {version_type: {} for version_type in titles}
+    
+    def add(self, messages):
+        """adds the entries of commit messages, can be fed while the history 
+        is walked
+
+        Args:
+            messages (Iterable(String)): commit messages
+        """
+        self.add_entries(self.classifier.iter_entries(messages))
+    
+    def add_entries(self, entries):
+        """adds already extracted entries, e.g. limited by path rules
 
-Todo:
-Nice to have:
-    Release ordner mit Jar, Zip
-    Release Notes
-"""
-# module accessing xml
-import xml.etree.ElementTree as ET 
-# regex for analyzing commit messages
-import re
-# accessing working directory
-import os
-# managing git repo
-from git import Repo
+        Args:
+            entries (Iterable(Tuple(String, String, String))): version type, 
+            scope and text as yielded by KeywordClassifier.iter_entries
+        """
+        notes = self.entries
+        for version_type, scope, text in entries:
+            notes[version_type].setdefault(scope, []).append(text.strip())
+    
+    def __len__(self):
+        return sum(len(texts) for scopes in self.entries.values() 
+                   for texts in scopes.values())
+    
+    def iter_markdown(self, version, date):
+        """yields the lines of the release in Markdown
 
-class MissingKeywordException(Exception):
+        Args:
+            version (string): version of the release
+            date (string): date of the release
+
+        Yields:
+            String: a single line
+        """
+        yield f"## {version} ({date})\n"
+        for version_type, scopes in self.entries.items():
+            if(not scopes):
+                continue
+            yield f"\n### {self.titles[version_type]}\n\n"
+            for scope, texts in scopes.items():
+                for text in texts:
+                    if(scope is None):
+                        yield f"- {text}\n"
+                    else:
+                        yield f"- **{scope}:** {text}\n"
+    
+    def iter_json(self, version, date):
+        """yields the entries of the release as JSON lines
+
+        Args:
+            version (string): version of the release
+            date (string): date of the release
+
+        Yields:
+            String: a single line
+        """
+        for version_type, scopes in self.entries.items():
+            for scope, texts in scopes.items():
+                for text in texts:
+                    yield json.dumps({"version": version, "date": date, 
+                                      "type": version_type, "scope": scope, 
+                                      "text": text}) + "\n"
+    
+    def write(self, path, version, format="markdown", date=None):
+        """appends the release to the changelog file
+
+        Args:
+            path (string): changelog file, created if it doesn't exist
+            version (string): version of the release
+            format (string, optional): "markdown" or "json". Defaults to 
+            "markdown".
+            date (string, optional): date of the release. Defaults to None 
+            (today).
+        """
+        if(date is None):
+            date = time.strftime("%Y-%m-%d")
+        match(format):
+            case "markdown":
+                lines = self.iter_markdown(version, date)
+            case "json":
+                lines = self.iter_json(version, date)
+            case _:
+                raise ValueError(f"Unknown changelog format: {format}")
+        with open(path, "a", encoding="utf-8") as file:
+            # blank line between the releases
+            if(format == "markdown" and file.tell() > 0):
+                file.write("\n")
+            file.writelines(lines)
+
+class ScanCache:
     """
-    raised when no keyword is found in the commit messages
+    on-disk cache of already scanned commits, so a rerun of the same pipeline 
+    only has to read the commits pushed since the last run
+
+    The cache stores the most recent commit scanned (head), the highest 
+    version type found between the last skip flag and that head and the 
+    version types of every single commit. Commit SHAs are content addressed, 
+    so the per commit entries stay valid even after a force-push, only head 
+    and highest have to be dropped if head is no longer part of the branch.
     """
-    pass
+    def __init__(self, path, max_entries=10000):
+        """
+        Args:
+            path (string): file the cache is stored in
+            max_entries (int, optional): maximum number of per commit entries, 
+            the oldest entries are evicted first. Defaults to 10000.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        # keywords and flag the cached results were computed with
+        self.keywords = None
+        # sha of the most recent commit scanned
+        self.head = None
+        # highest version type between the last flag and head
+        self.highest = None
+        # sha -> list of version types, None marks a flagged commit
+        # dicts keep the insertion order, so the oldest entries come first
+        self.commits = {}
+    
+    def load(self):
+        """
+        reads the cache file, a missing or broken file results in an empty 
+        cache
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+            self.keywords = data["keywords"]
+            self.head = data["head"]
+            self.highest = data["highest"]
+            self.commits = data["commits"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # start over, the cache will be rebuilt by the next scan
+            self.keywords = None
+            self.clear()
+    
+    def save(self):
+        """
+        writes the cache file, the old file is replaced atomically so an 
+        aborted run never leaves a half written cache behind
+        """
+        data = {
+            "keywords": self.keywords,
+            "head": self.head,
+            "highest": self.highest,
+            "commits": self.commits,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.path)
+    
+    def clear(self):
+        """
+        removes all cached results
+        """
+        self.invalidate()
+        self.commits = {}
+    
+    def invalidate(self):
+        """
+        drops the cached head, e.g. after the history was rewritten
+        the per commit entries are kept, because SHAs never change their 
+        content
+        """
+        self.head = None
+        self.highest = None
+    
+    def add(self, sha, version_types):
+        """adds the result of a single commit and evicts the oldest entries, 
+        if the cache grows beyond max_entries
+
+        Args:
+            sha (string): hexsha of the commit
+            version_types (List(String)): version types found in the commit, 
+            None if the commit carries the skip flag
+        """
+        self.commits[sha] = version_types
+        while(len(self.commits) > self.max_entries):
+            # dicts iterate in insertion order -> oldest entry first
+            del self.commits[next(iter(self.commits))]
 
 class SemanticVersioning:
-    def __init__(self):
+    def __init__(self, dirpath=None):
+        """
+        git repo and pom.xml are only opened, when they are used the first 
+        time, so classifying commits doesn't pay for them
+
+        Args:
+            dirpath (string, optional): directory of the maven project. 
+            Defaults to None (current working directory).
+        """
         # set variables for the keywords, so they can be changed easily
         # MAJOR.MINOR.PATCH as seen on https://semver.org/
         self.major = "major"
@@ -32,118 +1570,1123 @@ class SemanticVersioning:
         # only change it, if you also change the flag produced by the 
         # GH Actions bot
         self.actionsbot_flag = "[skip semVer]"
-        # git setup
-        self.dirpath  = os.getcwd() # path of current working directory
-        self.repo = Repo(self.dirpath) # git repo of current directory
-        self.main = self.repo.branches.main 
-        self.origin = self.repo.remotes.origin # remote loction of repo (github)
-        # xml ET setup
+        # bump policy, see load_policy
+        # further keywords per version type, e.g. {"feat": self.minor}
+        self.keyword_aliases = {}
+        # accept Conventional Commits ("!" and BREAKING CHANGE footers)
+        self.conventional_commits = False
+        # prerelease identifier per branch pattern, e.g. {"develop": "beta"}
+        self.prerelease_channels = {}
+        # (path patterns, highest version type) of commits, that only 
+        # change matching files, None ignores the commits
+        self.path_rules = []
+        # how the version is written to the pom:
+        # "tree" rewrites the whole tree, "inplace" only the version bytes
+        self.write_mode = "tree"
+        # update all modules of a multi module project with the version
+        self.reactor = False
+        # number of threads used for the modules, None lets python choose
+        self.workers = None
+        # backend used to read the history, "gitpython" or "log"
+        self.history_backend = "gitpython"
+        # branch the releases are made from, e.g. "release/1.x"
+        self.branch = "main"
+        # only scan commits, that are not reachable from the last release, 
+        # instead of stopping at the first flagged commit
+        self.graph_walk = False
+        # use semver tags (prefix + version) as release anchors instead of 
+        # the flagged commits
+        self.tag_anchors = False
+        self.tag_prefix = "v"
+        # compiled keyword pattern, created on first use
+        self._classifier = None
+        # git notes ref the post-commit hook records the version types in
+        self.notes_ref = "semver"
+        # Instrumentation collecting timings and counters, None to disable
+        self.instrumentation = None
+        # path of current working directory
+        self.dirpath = dirpath if dirpath is not None else os.getcwd()
+        # path of the pom.xml, None if the pom only exists in memory
+        self.pom_path = f"{self.dirpath}/pom.xml"
+    
+    @classmethod
+    def from_pom_string(cls, pom):
+        """creates an object for a pom.xml, that only exists in memory
+        set_version only changes the version in memory
+
+        Args:
+            pom (string, bytes): content of a pom.xml
+
+        Returns:
+            SemanticVersioning: object using the given pom
+        """
+        import xml.etree.ElementTree as ET
+        semver = cls()
+        semver.pom_path = None
         # register namespace before parsing --> otherwise multiple errors
         ET.register_namespace('', "http://maven.apache.org/POM/4.0.0")
-        self.tree = ET.parse(f"{self.dirpath}/pom.xml") # pom xml tree
-        self.root = self.tree.getroot() # root of xml tree
+        semver.tree = ET.ElementTree(ET.fromstring(pom))
+        return semver
+    
+    @classmethod
+    def from_version(cls, version):
+        """creates an object for a single version string without any pom.xml
+        set_version only changes the version in memory
+
+        Args:
+            version (string): current version
 
-        # location of the version number in pom 
-        self.version_location = self.root.find(
-            "{http://maven.apache.org/POM/4.0.0}version")    
+        Returns:
+            SemanticVersioning: object using the given version
+        """
+        import xml.etree.ElementTree as ET
+        semver = cls()
+        semver.pom_path = None
+        semver.version_location = ET.Element(
+            "{http://maven.apache.org/POM/4.0.0}version")
+        semver.version_location.text = version
+        return semver
+    
+    def load_policy(self, path=None):
+        """loads the bump policy of the project, a JSON file like:
         
+            {
+                "major": ["major", "breaking"],
+                "minor": ["minor", "feat"],
+                "patch": ["fix", "perf"],
+                "flag": "[skip semVer]",
+                "conventional": true,
+                "channels": {"develop": "beta", "release/*": "rc"},
+                "paths": [{"paths": ["docs/*", "*.md"], "bump": null},
+                          {"paths": ["src/test/*"], "bump": "fix"}]
+            }
         
+        the first keyword of a level is the version type returned, the 
+        others are aliases, every entry is optional
+
+        Args:
+            path (string, optional): policy file. Defaults to None 
+            (.semver.json in the project directory).
+
+        Raises:
+            ValueError: if the policy contains unknown entries
+
+        Returns:
+            bool: False if the project has no policy file
+        """
+        if(path is None):
+            path = os.path.join(self.dirpath, ".semver.json")
+        try:
+            with open(path, encoding="utf-8") as file:
+                policy = json.load(file)
+        except FileNotFoundError:
+            return False
+        unknown = set(policy) - {"major", "minor", "patch", "flag", 
+                                 "conventional", "channels", "paths"}
+        if(unknown):
+            raise ValueError(f"Unknown policy entries: {sorted(unknown)}")
+        aliases = {}
+        for level in ["major", "minor", "patch"]:
+            keywords = policy.get(level, [getattr(self, level)])
+            if(isinstance(keywords, str)):
+                keywords = [keywords]
+            setattr(self, level, keywords[0])
+            for keyword in keywords[1:]:
+                aliases[keyword] = keywords[0]
+        self.keyword_aliases = aliases
+        self.actionsbot_flag = policy.get("flag", self.actionsbot_flag)
+        self.conventional_commits = policy.get("conventional", False)
+        self.prerelease_channels = policy.get("channels", {})
+        levels = self.classifier.levels
+        self.path_rules = []
+        for rule in policy.get("paths", []):
+            bump = rule.get("bump")
+            if(bump is not None and bump not in levels):
+                raise ValueError(f"Unknown bump in path rule: {bump!r}")
+            self.path_rules.append(
+                (tuple(rule["paths"]), None if bump is None else levels[bump]))
+        return True
+    
+    @cached_property
+    def repo(self):
+        """git repo of the project directory"""
+        # GitPython is the slowest import, only load it for a repo
+        from git import Repo
+        return Repo(self.dirpath)
+    
+    @cached_property
+    def main(self):
+        """release branch of the repo (self.branch)"""
+        return self.repo.heads[self.branch]
+    
+    @cached_property
+    def release_tag(self):
+        """sha and version of the last release tag on the branch, None if 
+        the branch was never tagged"""
+        tags = self.read_tag_index(merged=self.main.path)
+        if(not tags):
+            return None
+        return max(tags.items(), key=lambda item: item[1])
+    
+    @cached_property
+    def origin(self):
+        """remote loction of repo (github)"""
+        return self.repo.remotes.origin
+    
+    @cached_property
+    def tree(self):
+        """pom xml tree"""
+        import xml.etree.ElementTree as ET
+        # register namespace before parsing --> otherwise multiple errors
+        ET.register_namespace('', "http://maven.apache.org/POM/4.0.0")
+        with self._span("pom_parse"):
+            tree = ET.parse(self.pom_path)
+        if(self.instrumentation is not None):
+            self.instrumentation.count(
+                "bytes_parsed", os.path.getsize(self.pom_path))
+        return tree
+    
+    @cached_property
+    def root(self):
+        """root of xml tree"""
+        return self.tree.getroot()
+    
+    @cached_property
+    def version_location(self):
+        """location of the version number in pom"""
+        return self.root.find("{http://maven.apache.org/POM/4.0.0}version")
         
+    def _span(self, name):
+        """returns a context manager measuring a stage, if instrumentation 
+        is enabled
+
+        Args:
+            name (string): name of the stage
+
+        Returns:
+            _Span, _NoSpan: context manager for the with statement
+        """
+        if(self.instrumentation is None):
+            return _NO_SPAN
+        return self.instrumentation.span(name)
+    
     def write_to_xml(self):
         """
-        writes the current element tree on self.tree in pom.xml
+        writes the current element tree on self.tree in pom.xml
+        """
+        # a pom in memory has no file to write to
+        if(self.pom_path is None):
+            return
+        self.tree.write(self.pom_path, encoding="utf-8", 
+                        xml_declaration=True)
+        
+    def set_version(self, new_version):
+        """sets a new version and writes it to the pom.xml file
+
+        Args:
+            new_version (string): new version the pom should be updated to
+        """
+        if(self.pom_path is None):
+            # the pom only exists in memory
+            self.version_location.text = new_version
+            return
+        if(self.write_mode == "inplace" and not self.reactor):
+            # only replace the bytes of the version, the pom isn't parsed
+            with self._span("pom_write"):
+                write_pom_version(self.pom_path, new_version)
+            # a tree parsed before is outdated now
+            self.reload_pom()
+            return
+        # set the new version in the xml Element tree
+        self.version_location.text = new_version
+        with self._span("pom_write"):
+            if(self.reactor):
+                # root, module, parent and dependency versions of all modules
+                update_reactor_versions(
+                    self.pom_path, new_version, self.workers)
+            else:
+                self.write_to_xml() # write updated Element Tree to pom.xml
+    
+    def get_version(self):
+        """returns the version number of the project
+
+        Raises:
+            ValueError: if the pom has no project version (inplace mode)
+
+        Returns:
+            string: version of the pom.xml
+        """
+        if(self.write_mode == "inplace" and self.pom_path is not None):
+            # scans the pom only up to the version, no tree is built
+            with open(self.pom_path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, 
+                               access=mmap.ACCESS_READ) as data:
+                    span = find_pom_version(data)
+                    if(span is None):
+                        raise ValueError(
+                            f"No project version found in {self.pom_path}")
+                    text = data[span[0]:span[1]].decode("utf-8")
+            # undo the escaping of write_pom_version
+            return text.strip().replace("&lt;", "<").replace(
+                "&gt;", ">").replace("&amp;", "&")
+        version = self.version_location.text
+        return version
+    
+    def get_release_version(self):
+        """returns the version of the last release, the version of the 
+        release tag if tag anchors are used, else the version of the pom.xml
+
+        Returns:
+            string: version of the last release
+        """
+        if(self.tag_anchors and self.release_tag is not None):
+            return str(self.release_tag[1])
+        return self.get_version()
+    
+    def modify_version_number(self, version_type):
+        """Changes the Version number based on the given version type
+
+        Args:
+            version_type (string): defines which version number should be 
+            updated
+        """
+        # get version string
+        version = self.get_release_version() 
+        # check if the version number is a string
+        if type(version) != str:
+            raise TypeError("Version must be string type")
+        # set the new version in pom
+        self.set_version(self.compute_next_version(version, version_type))
+    
+    def compute_next_version(self, version, version_type):
+        """computes the next version without changing the pom
+
+        Args:
+            version (string): current version
+            version_type (string): defines which version number should be 
+            updated
+
+        Raises:
+            ValueError: if the version doesn't fit the SemVer Specifications
+
+        Returns:
+            string: the next version
+        """
+        # check if the version number fits the semver Specification
+        current = Version.parse(version)
+        channel = self.get_channel()
+        if(channel is not None and version_type in self.classifier.ranks):
+            return str(self.compute_next_prerelease(
+                current, version_type, channel))
+        # in case there is a SNAPSHOT Version only release it
+        if(current.prerelease is not None 
+           and "SNAPSHOT" in current.prerelease):
+            return str(current.finalize())
+        # match case for the version_type arg 
+        # (Python Version of switch-Statement)
+        match(version_type):
+            # in case a Major Release is triggered
+            case self.major:
+                # increase major number and set minor and patch number to 0
+                return str(current.bump_major())
+            # in case a Minor Release is triggered
+            case self.minor:
+                # increase minor number and set patch number to 0
+                return str(current.bump_minor())
+            # in case a Patch Release is triggered
+            case self.patch: 
+                # increase patch number
+                return str(current.bump_patch())
+        # unknown version types don't change the version
+        return str(current)
+    
+    def get_channel(self):
+        """returns the prerelease channel of the branch
+
+        Returns:
+            string: prerelease identifier, e.g. "beta", None for releases
+        """
+        if(not self.prerelease_channels):
+            return None
+        from fnmatch import fnmatchcase
+        for pattern, channel in self.prerelease_channels.items():
+            if(fnmatchcase(self.branch, pattern)):
+                return channel
+        return None
+    
+    def compute_next_prerelease(self, current, version_type, channel):
+        """computes the next prerelease of a channel, e.g. 1.2.0 -> 
+        1.3.0-beta.1 -> 1.3.0-beta.2 for minor releases
+
+        Args:
+            current (Version): current version
+            version_type (string): version type of the new commits
+            channel (string): prerelease identifier, e.g. "beta"
+
+        Returns:
+            Version: the next prerelease
+        """
+        if(current.prerelease is None):
+            match(version_type):
+                case self.major:
+                    core = current.bump_major()
+                case self.minor:
+                    core = current.bump_minor()
+                case _:
+                    core = current.bump_patch()
+            return Version(core.major, core.minor, core.patch, f"{channel}.1")
+        # the prerelease already is the next version, unless the bump is 
+        # higher than the one it was created for
+        core = current.finalize()
+        if(version_type == self.major and (core.minor or core.patch)):
+            core = core.bump_major()
+        elif(version_type == self.minor and core.patch):
+            core = core.bump_minor()
+        number = 1
+        prefix = f"{channel}."
+        if(core == current.finalize() 
+           and current.prerelease.startswith(prefix) 
+           and current.prerelease[len(prefix):].isdigit()):
+            number = int(current.prerelease[len(prefix):]) + 1
+        return Version(core.major, core.minor, core.patch, 
+                       f"{channel}.{number}")
+    
+    def iter_history(self, max_depth=None, since=None, rev=None):
+        """yields sha and message of the commits on main, most recent first
+        the backend used to read the history is set by self.history_backend:
+            "gitpython": reads every commit through Repo.iter_commits
+            "log": reads all messages from a single git log stream
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+            rev (string, optional): revision or range to walk, e.g. 
+            "main..FETCH_HEAD". Defaults to None (main).
+
+        Yields:
+            Tuple(String, String): hexsha and message of a commit
+        """
+        history = self._iter_backend(max_depth, since, rev)
+        instrumentation = self.instrumentation
+        if(instrumentation is None):
+            yield from history
+            return
+        scanned = 0
+        try:
+            for commit in history:
+                scanned += 1
+                yield commit
+        finally:
+            instrumentation.count("commits_scanned", scanned)
+    
+    def _iter_backend(self, max_depth=None, since=None, rev=None):
+        """yields sha and message of the commits from the selected backend, 
+        see iter_history
+        """
+        if(rev is None):
+            rev = self.main.path
+        match(self.history_backend):
+            case "gitpython":
+                # only pass the bounds that are set on to git rev-list
+                bounds = {}
+                if(max_depth is not None):
+                    bounds["max_count"] = max_depth
+                if(since is not None):
+                    bounds["since"] = since
+                for commit in self.repo.iter_commits(rev=rev, **bounds):
+                    yield commit.hexsha, commit.message
+            case "log":
+                yield from self._iter_log(max_depth, since, rev)
+            case _:
+                raise ValueError(
+                    f"Unknown history backend: {self.history_backend}")
+    
+    def _iter_log(self, max_depth=None, since=None, rev=None):
+        """yields sha and message of the commits on main from a single 
+        git log process, no GitPython object is created per commit
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+            rev (string, optional): revision or range to walk, e.g. 
+            "main..FETCH_HEAD". Defaults to None (main).
+
+        Yields:
+            Tuple(String, String): hexsha and message of a commit
+        """
+        import subprocess
+        # NUL separated records: sha NUL message NUL
+        command = ["git", "log", "--format=%H%x00%B%x00"]
+        if(max_depth is not None):
+            command.append(f"--max-count={max_depth}")
+        if(since is not None):
+            command.append(f"--since={since}")
+        command += [rev if rev is not None else self.main.path, "--"]
+        # no GitPython object is used, if rev is given
+        process = subprocess.Popen(command, cwd=self.dirpath, 
+                                   stdout=subprocess.PIPE)
+        try:
+            yield from iter_log_records(process.stdout)
+        finally:
+            # the caller may stop early, e.g. at the skip flag
+            process.stdout.close()
+            if(process.poll() is None):
+                process.terminate()
+            process.wait()
+    
+    def iter_commits_til_tag(self, max_depth=None, since=None, rev=None):
+        """yields the commit messages lazily, until the skip ci flag is found
+        the history is only walked as far as needed, so commits older than 
+        the flag are never loaded
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date, 
+            e.g. "2 weeks ago" or "2022-05-01". Defaults to None (no limit).
+            rev (string, optional): revision or range to walk, e.g. 
+            "main..FETCH_HEAD". Defaults to None (main).
+
+        Yields:
+            String: message of a commit pushed after the flag
+        """
+        # the history is a generator, so each commit is only read on demand
+        for sha, message in self.iter_history(max_depth, since, rev):
+            # if the flag used by the GH Actions Bot is found 
+            if(self.actionsbot_flag in message):
+                # all older commits were part of the last release
+                return
+            yield message
+    
+    def find_release_point(self, rev=None):
+        """returns the last flagged commit on the first-parent history of 
+        the branch, flagged commits on merged side branches are ignored
+        git reads the commit-graph file, if it exists, so only the messages 
+        of the first-parent chain after the release are loaded
+
+        Args:
+            rev (string, optional): revision to start from. Defaults to None 
+            (self.branch).
+
+        Returns:
+            string: sha of the last release, None if there was no release
+        """
+        import subprocess
+        output = subprocess.run(
+            ["git", "log", "--first-parent", "--fixed-strings", 
+             f"--grep={self.actionsbot_flag}", "--max-count=1", "--format=%H",
+             rev if rev is not None else self.main.path, "--"],
+            cwd=self.repo.working_dir, capture_output=True, text=True, 
+            check=True).stdout.strip()
+        return output or None
+    
+    def iter_commits_since_release(self, max_depth=None, since=None, 
+                                   rev=None):
+        """yields the commit messages reachable from the branch but not from 
+        the last release, on all parents of merge commits
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+            rev (string, optional): revision to start from. Defaults to None 
+            (self.branch).
+
+        Yields:
+            String: message of a commit pushed after the last release
+        """
+        if(rev is None):
+            rev = self.main.path
+        release = self.find_release_point(rev)
+        if(release is not None):
+            # git rev-list stops at the release on every parent
+            rev = f"{release}..{rev}"
+        for sha, message in self.iter_history(max_depth, since, rev):
+            # releases of other branches merged in don't end the walk
+            if(self.actionsbot_flag not in message):
+                yield message
+    
+    def read_tag_index(self, merged=None):
+        """reads all semver tags with a single git for-each-ref, annotated 
+        tags are peeled to the tagged commit
+
+        Args:
+            merged (string, optional): only tags reachable from this 
+            revision. Defaults to None (all tags).
+
+        Returns:
+            Dict(String, Version): commit sha -> version of the tag
+        """
+        import subprocess
+        command = ["git", "for-each-ref", 
+                   "--format=%(objectname) %(*objectname) %(refname:strip=2)"]
+        if(merged is not None):
+            command.append(f"--merged={merged}")
+        command.append(f"refs/tags/{self.tag_prefix}*")
+        output = subprocess.run(command, cwd=self.repo.working_dir, 
+                                capture_output=True, text=True, 
+                                check=True).stdout
+        tags = {}
+        for line in output.splitlines():
+            # lightweight tags have no peeled object
+            sha, peeled, name = line.split(" ", 2)
+            try:
+                version = Version.parse(name[len(self.tag_prefix):])
+            except ValueError:
+                # e.g. v2-beta, not a release
+                continue
+            commit = peeled or sha
+            if(commit not in tags or tags[commit] < version):
+                tags[commit] = version
+        return tags
+    
+    def iter_commits_since_tag(self, max_depth=None, since=None):
+        """yields the commit messages after the last release tag, on all 
+        parents of merge commits
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Yields:
+            String: message of a commit made after the last release
+        """
+        rev = self.main.path
+        if(self.release_tag is not None):
+            rev = f"{self.release_tag[0]}..{rev}"
+        for sha, message in self.iter_history(max_depth, since, rev):
+            # the version commit of the bot, if it was tagged afterwards
+            if(self.actionsbot_flag not in message):
+                yield message
+    
+    def write_commit_graph(self):
+        """writes the commit-graph file of the repo, git uses its generation 
+        numbers to stop walking a range early
+        """
+        import subprocess
+        subprocess.run(["git", "commit-graph", "write", "--reachable"], 
+                       cwd=self.repo.working_dir, capture_output=True, 
+                       check=True)
+    
+    def iter_release_commits(self, max_depth=None, since=None):
+        """yields the commit messages of the next release, the release 
+        boundary depends on self.tag_anchors and self.graph_walk
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Returns:
+            Iterator(String): messages of the commits, most recent first
+        """
+        if(self.tag_anchors):
+            return self.iter_commits_since_tag(max_depth, since)
+        if(self.graph_walk):
+            return self.iter_commits_since_release(max_depth, since)
+        return self.iter_commits_til_tag(max_depth, since)
+    
+    def iter_release_history(self, max_depth=None, since=None):
+        """like iter_release_commits, but yields the sha with the message
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Yields:
+            Tuple(String, String): hexsha and message of a commit
+        """
+        rev, stop_at_flag = self._release_range()
+        for sha, message in self.iter_history(max_depth, since, rev):
+            if(self.actionsbot_flag in message):
+                if(stop_at_flag):
+                    return
+                continue
+            yield sha, message
+    
+    def _release_range(self):
+        """returns the revision range of the next release, depending on 
+        self.tag_anchors and self.graph_walk
+
+        Returns:
+            Tuple(String, bool): range for iter_history (None for the 
+            branch) and whether the walk ends at the first flagged commit
+        """
+        if(self.tag_anchors):
+            if(self.release_tag is None):
+                return None, False
+            return f"{self.release_tag[0]}..{self.main.path}", False
+        if(self.graph_walk):
+            release = self.find_release_point()
+            if(release is None):
+                return None, False
+            return f"{release}..{self.main.path}", False
+        # the flag only ends the walk, if there is no other release anchor
+        return None, True
+    
+    def read_changed_files(self, shas):
+        """reads the files changed by commits with a single git diff-tree
+
+        Args:
+            shas (Iterable(String)): commits
+
+        Returns:
+            Dict(String, List(String)): sha -> changed paths, commits without 
+            changes (e.g. empty or merge commits) are missing
+        """
+        import subprocess
+        shas = list(shas)
+        output = subprocess.run(
+            ["git", "diff-tree", "--stdin", "-r", "--root", "--name-only", 
+             "-z"], 
+            cwd=self.dirpath, input="\n".join(shas) + "\n", 
+            capture_output=True, text=True, check=True).stdout
+        requested = set(shas)
+        files = {}
+        paths = None
+        # NUL separated: sha, followed by the paths it changed
+        for field in output.split("\0"):
+            if(field in requested):
+                paths = files[field] = []
+            elif(field and paths is not None):
+                paths.append(field)
+        return files
+    
+    def apply_path_rules(self, files, version_types):
+        """limits the version types of a commit by the first path rule, 
+        that matches all of its changed files
+
+        Args:
+            files (List(String)): paths changed by the commit
+            version_types (List(String)): version types of the commit
+
+        Returns:
+            List(String): the limited version types
+        """
+        from fnmatch import fnmatchcase
+        if(not files):
+            return version_types
+        for patterns, highest in self.path_rules:
+            if(all(any(fnmatchcase(path, pattern) for pattern in patterns) 
+                   for path in files)):
+                if(highest is None):
+                    # e.g. documentation only commits
+                    return []
+                ranks = self.classifier.ranks
+                return [highest if ranks[version_type] > ranks[highest] 
+                        else version_type for version_type in version_types]
+        return version_types
+    
+    def get_version_types(self, max_depth=None, since=None):
+        """returns the version types of the next release, the path rules 
+        of the policy are applied to every commit
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Returns:
+            List(String): version types found in the commits
+        """
+        with self._span("history"):
+            history = list(self.iter_release_history(max_depth, since))
+        with self._span("classify"):
+            return self._classify_history(history)
+    
+    def _classify_history(self, history):
+        """returns the version types of commits, the path rules of the 
+        policy are applied to every commit
+
+        Args:
+            history (List(Tuple(String, String))): sha and message of the 
+            commits
+
+        Returns:
+            List(String): version types found in the commits
+        """
+        version_types = []
+        for commit_types in self._classify_commits(history):
+            version_types += commit_types
+        return version_types
+    
+    def _classify_commits(self, history):
+        """returns the version types of every commit, the path rules of the 
+        policy are applied, the changed files of all commits are read with 
+        a single git process
+        every mode, that classifies commits, has to use this method (or 
+        _classify_history), so the policy is applied the same way
+
+        Args:
+            history (List(Tuple(String, String))): sha and message of the 
+            commits
+
+        Returns:
+            List(List(String)): version types of each commit, in the order 
+            of history
+        """
+        files = {}
+        if(self.path_rules and history):
+            files = self.read_changed_files(sha for sha, message in history)
+        iter_version_types = self.classifier.iter_version_types
+        result = []
+        for sha, message in history:
+            commit_types = list(iter_version_types((message,)))
+            if(sha in files):
+                commit_types = self.apply_path_rules(files[sha], commit_types)
+            result.append(commit_types)
+        return result
+    
+    def bump(self, max_depth=None, since=None, write=True):
+        """computes and writes the next version, nothing is printed and no 
+        exception is raised if no keyword was used
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+            write (bool, optional): write the new version to the pom.xml. 
+            Defaults to True.
+
+        Returns:
+            BumpResult: versions, bump type, counts, commits and timings
+        """
+        timings = {}
+        start = time.perf_counter()
+        with self._span("history"):
+            history = list(self.iter_release_history(max_depth, since))
+        timings["history"] = time.perf_counter() - start
+        start = time.perf_counter()
+        with self._span("classify"):
+            version_types = self._classify_history(history)
+        timings["classify"] = time.perf_counter() - start
+        return self.bump_from_types(
+            version_types, write, 
+            tuple(sha for sha, message in history), timings)
+    
+    def bump_from_types(self, version_types, write=True, commits=(), 
+                        timings=None):
+        """like bump, but with version types computed before, e.g. by 
+        get_version_types_cached or get_version_types_from_notes
+
+        Args:
+            version_types (List(String)): version types of the release
+            write (bool, optional): write the new version to the pom.xml. 
+            Defaults to True.
+            commits (Tuple(String), optional): shas of the commits scanned. 
+            Defaults to () (unknown).
+            timings (Dict(String, float), optional): seconds of the stages 
+            run before. Defaults to None.
+
+        Returns:
+            BumpResult: versions, bump type, counts, commits and timings
+        """
+        timings = dict(timings or {})
+        old_version = self.get_release_version()
+        counts = {self.major: 0, self.minor: 0, self.patch: 0}
+        for version_type in version_types:
+            counts[version_type] += 1
+        bump_type = self.classifier.highest_of(version_types)
+        new_version = old_version
+        written = False
+        if(bump_type is not None):
+            new_version = self.compute_next_version(old_version, bump_type)
+            if(write):
+                start = time.perf_counter()
+                self.set_version(new_version)
+                timings["pom_write"] = time.perf_counter() - start
+                written = True
+        return BumpResult(old_version, new_version, bump_type, counts, 
+                          commits, timings, written)
+    
+    def write_changelog(self, path, commits=None, format="markdown", 
+                        max_depth=None, since=None):
+        """appends the release notes of the current version to a changelog, 
+        call it after the version was updated
+
+        Args:
+            path (string): changelog file, e.g. CHANGELOG.md
+            commits (Iterable(String), optional): messages of the release, 
+            they are listed without the path rules of the policy. Defaults 
+            to None (read from the history, the path rules limit or drop 
+            the entries like the version types of the commits).
+            format (string, optional): "markdown" or "json". Defaults to 
+            "markdown".
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Returns:
+            Changelog: the release notes written
+        """
+        changelog = Changelog(self.classifier)
+        with self._span("changelog"):
+            if(commits is None and self.path_rules):
+                history = list(self.iter_release_history(max_depth, since))
+                changelog.add_entries(self._iter_limited_entries(history))
+            else:
+                if(commits is None):
+                    commits = self.iter_release_commits(max_depth, since)
+                changelog.add(commits)
+            changelog.write(path, self.get_version(), format)
+        return changelog
+    
+    def _iter_limited_entries(self, history):
+        """yields the changelog entries of commits, the path rules of the 
+        policy are applied to the version type of every entry
+
+        Args:
+            history (List(Tuple(String, String))): sha and message of the 
+            commits
+
+        Yields:
+            Tuple(String, String, String): version type, scope and text
+        """
+        files = self.read_changed_files(sha for sha, message in history)
+        iter_entries = self.classifier.iter_entries
+        for sha, message in history:
+            for version_type, scope, text in iter_entries((message,)):
+                limited = self.apply_path_rules(files.get(sha), 
+                                                [version_type])
+                # e.g. documentation only commits are not listed
+                if(limited):
+                    yield limited[0], scope, text
+    
+    def package_release(self, release_dir=None):
+        """collects the artifacts of the current version into the release 
+        folder, call it after the project was built with the new version
+
+        Args:
+            release_dir (string, optional): folder of all releases. Defaults 
+            to None (release/ in the project directory).
+
+        Returns:
+            Dict: the manifest written to release/<version>/manifest.json
         """
-        self.tree.write("pom.xml", encoding="utf-8", xml_declaration=True)
-        
-    def set_version(self, new_version):
-        """sets a new version and writes it to the pom.xml file
+        with self._span("package"):
+            return package_release(self.dirpath, self.get_version(), 
+                                   release_dir, workers=self.workers)
+    
+    def plan(self, revision="HEAD"):
+        """computes the next version of a revision without a checkout and 
+        without writing anything, the pom.xml is read from the object 
+        database
+        only git processes are used and the object is not changed, so many 
+        threads can plan with the same object at the same time
 
         Args:
-            new_version (string): new version the pom should be updated to
+            revision (string, optional): revision or range, e.g. 
+            "main..pr-head". Defaults to "HEAD".
+
+        Raises:
+            ValueError: if the pom.xml has no version
+
+        Returns:
+            VersionPlan: current and next version, bump type and the commits
         """
-        # print to see, if version was updated correct
-        # set the new version in the xml Element tree
-        self.version_location.text = new_version
-        self.write_to_xml() # write updated Element Tree to pom.xml
-        # print to see, if version was updated correct
+        import subprocess
+        # a range is released on top of its base, e.g. the PR on main
+        base = revision
+        if(".." in revision):
+            base = revision.split("..", 1)[0] or "HEAD"
+        pom = subprocess.run(["git", "show", f"{base}:./pom.xml"], 
+                             cwd=self.dirpath, capture_output=True, 
+                             check=True).stdout
+        location = find_pom_version(pom)
+        if(location is None):
+            raise ValueError(f"pom.xml of {base} has no version")
+        old_version = pom[location[0]:location[1]].decode("utf-8").strip()
+        history = []
+        for sha, message in self._iter_log(rev=revision):
+            if(self.actionsbot_flag in message):
+                break
+            history.append((sha, message))
+        # no span, the instrumentation is not shared between threads
+        version_types = self._classify_history(history)
+        bump_type = self.classifier.highest_of(version_types)
+        new_version = old_version
+        if(bump_type is not None):
+            new_version = self.compute_next_version(old_version, bump_type)
+        return VersionPlan(revision, old_version, new_version, bump_type, 
+                           tuple(sha for sha, message in history))
     
-    def get_version(self):
-        """returns the version number of the project
+    def get_commits_since(self, base, head):
+        """returns the commits after base up to head, until the skip ci flag
+
+        Args:
+            base (string): commit, that was already scanned
+            head (string): most recent commit to scan
 
         Returns:
-            string: version of the pom.xml
+            Tuple(List(String), bool): messages of the commits and whether 
+            the flag was found, if not the commits before base still belong 
+            to the release
         """
-        version = self.version_location.text
-        return version
+        history, flag_found = self.get_history_since(base, head)
+        return [message for sha, message in history], flag_found
     
-    def modify_version_number(self, version_type):
-        """Changes the Version number based on the given version type
+    def get_history_since(self, base, head):
+        """like get_commits_since, but returns the sha with the message
 
         Args:
-            version_type (string): defines which version number should be 
-            updated
+            base (string): commit, that was already scanned, None to walk 
+            the whole history of head
+            head (string): most recent commit to scan
+
+        Returns:
+            Tuple(List(Tuple(String, String)), bool): sha and message of the 
+            commits and whether the flag was found
         """
-        # get version string
-        version = self.get_version() 
-        # check if the version number is a string
-        if type(version) != str:
-            raise TypeError("Version must be string type")
-        # check if the version number fits the semver Specification
-        if re.match(r"[0-9]+\.[0-9]+\.[0-9]+",version) == None:
-            raise ValueError("Version must fit the SemVer Specifications")
-        # split the version number in it's 3 components
-        major_num, minor_num, patch_num = version.split('.')
-        # match case for the version_type arg 
-        # (Python Version of switch-Statement)
-        # in case there is a SNAPSHOT Version
-        if("SNAPSHOT" in patch_num):
-            # only take the patch_number
-            patch_num = patch_num.split("-")[0] 
-        else: 
-            match(version_type):
-                # in case a Major Release is triggered
-                case self.major:
-                    # increase major number and set minor and patch number to 0
-                    major_num = int(major_num)+1
-                    minor_num = 0
-                    patch_num = 0
-                # in case a Minor Release is triggered
-                case self.minor:
-                    # increase minor number and set patch number to 0
-                    minor_num = int(minor_num)+1
-                    patch_num = 0
-                # in case a Patch Release is triggered
-                case self.patch: 
-                    # increase patch number
-                    patch_num = int(patch_num)+1
-        # merge the version number together        
-        version = f"{major_num}.{minor_num}.{patch_num}"
-        # set the new version in pom
-        self.set_version(version)
+        rev = head if base is None else f"{base}..{head}"
+        history = []
+        for sha, message in self.iter_history(rev=rev):
+            if(self.actionsbot_flag in message):
+                return history, True
+            history.append((sha, message))
+        return history, False
     
-    def get_commits_til_tag(self):
+    def get_commits_til_tag(self, max_depth=None, since=None):
         """returns all commits, until the skip ci flag is found
         skip ci is in commits pushed by GH Actions
 
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
         Returns:
             List(String): strings of multiple Commits
         """
-        # gathers all commits
-        commits = list(self.repo.iter_commits(rev=self.main))
-        print("last commits: ")
-        for i in range(len(commits)):
-            # convert the commits to only read the message
-            commits[i] = commits[i].message
-            # if the flag used by the GH Actions Bot is found 
-            if(self.actionsbot_flag in commits[i]):
-                # Only Take commits pushed after the flag was found
-                commits = commits[:i] 
-                break   
-            # print the commits chronologically (most recent first)
-            print(f"{i}:", commits[i])
+        import logging
+        logger = _logger()
+        # only format the commits, if they are logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.info("last commits:")
+        commits = []
+        with self._span("history"):
+            history = self.iter_release_commits(max_depth, since)
+            for i, commit in enumerate(history):
+                # log the commits chronologically (most recent first)
+                if(debug):
+                    logger.debug("%d: %s", i, commit, 
+                                 extra={"index": i, "commit": commit})
+                commits.append(commit)
             
         return commits
     
+    def get_version_types_cached(self, cache=None, max_depth=None, 
+                                 since=None):
+        """returns the version types of the next release (see 
+        iter_release_history), only the commits newer than the last cached 
+        run are read (the range from its head to the tip of the branch), a 
+        run bounded by max_depth or since only reuses the cached commits
+
+        Args:
+            cache (ScanCache, optional): cache to use. Defaults to None 
+            (.git/semver-cache of the repo is used).
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Returns:
+            List(String): version types found in the commits
+        """
+        if(cache is None):
+            cache = ScanCache(os.path.join(self.repo.git_dir, "semver-cache"))
+        cache.load()
+        # results computed with other keywords or since another release 
+        # can not be reused
+        rev, stop_at_flag = self._release_range()
+        keywords = [self.patch, self.minor, self.major, self.actionsbot_flag, 
+                    *self.classifier.keywords[3:]]
+        if(not stop_at_flag):
+            keywords.append(f"release={rev}")
+        if(self.path_rules):
+            keywords.append(f"paths={self.path_rules!r}")
+        if(cache.keywords != keywords):
+            cache.clear()
+            cache.keywords = keywords
+        tip = self.main.commit.hexsha
+        # after a force-push the cached head may no longer be on the branch
+        if(cache.head is not None and not self._is_ancestor(cache.head, tip)):
+            cache.invalidate()
+        # a bounded walk doesn't see the whole release, so it neither uses 
+        # nor updates the summary of the last run
+        bounded = max_depth is not None or since is not None
+        version_types = [] # version types found since the flag
+        history = [] # sha, message and cached version types of the commits
+        highest = None # summary of the commits scanned by the last run
+        with self._span("history"):
+            if(cache.head is None or bounded):
+                for sha, message in self.iter_release_history(max_depth, 
+                                                              since):
+                    history.append((sha, message, cache.commits.get(sha)))
+            else:
+                highest = cache.highest
+                # the range also holds the commits of branches merged since 
+                # the last run, even if they are older than the cached head
+                for sha, message in self.iter_history(
+                        rev=f"{cache.head}..{tip}"):
+                    if(self.actionsbot_flag in message):
+                        if(stop_at_flag):
+                            # released after the last run
+                            highest = None
+                            break
+                        continue
+                    history.append((sha, message, cache.commits.get(sha)))
+        # only classify commits never seen before
+        new_history = [(sha, message) for sha, message, commit_types 
+                       in history if commit_types is None]
+        with self._span("classify"):
+            new_types = dict(zip((sha for sha, message in new_history), 
+                                 self._classify_commits(new_history)))
+        for sha, message, commit_types in history:
+            if(commit_types is None):
+                commit_types = new_types[sha]
+            version_types += commit_types
+        if(highest is not None):
+            version_types.append(highest)
+        # add the oldest commits first, so they are evicted first
+        for sha, message in reversed(new_history):
+            cache.add(sha, new_types[sha])
+        if(not bounded):
+            cache.head = tip
+            cache.highest = self.get_highest_version_type(version_types)
+        cache.save()
+        return version_types
+    
+    def _is_ancestor(self, ancestor, rev):
+        """checks whether a commit is part of the history of rev
+
+        Args:
+            ancestor (string): sha of the possible ancestor
+            rev (string): revision whose history is checked
+
+        Returns:
+            bool: True if ancestor is reachable from rev
+        """
+        from git import GitCommandError
+        try:
+            return self.repo.is_ancestor(ancestor, rev)
+        except GitCommandError:
+            # unknown object, e.g. garbage collected after a force-push
+            return False
+    
     def analyze_git_commits(self, commits):
         """
         analyze git commits for keywords used to increase version number
@@ -168,22 +2711,28 @@ class SemanticVersioning:
             major(semver): removed and renamed multiple functions
         """
         
-        matches = [] # create empty list for saving the matched strings
-        for commit in commits: # for all commits
-            # create a pattern using the chosen keywords
-            # re.escape for the possibility to use special chars like 
-            # '+' in the keyword
-            pattern = r"((" + re.escape(self.patch) + r"|" + re.escape(
-                self.minor) + r"|" + re.escape(self.major) + r")\(.+\):.+)"
-            # look for the keywords in the commit messages and append them 
-            # to the matches array
-            matches += re.findall(pattern = pattern,
-              string = commit, flags=re.MULTILINE)
-        # get only the version types in a list
-        version_types = map(lambda x: x[1], matches)
-        version_types = list(version_types)
+        # the pattern is only compiled once by the classifier
+        with self._span("classify"):
+            version_types = list(self.classifier.iter_version_types(commits))
+        if(self.instrumentation is not None):
+            self.instrumentation.count("matches_found", len(version_types))
         return version_types
     
+    @property
+    def classifier(self):
+        """the keyword classifier for the current keywords, it is rebuilt if 
+        one of the keywords was changed
+
+        Returns:
+            KeywordClassifier: classifier for major, minor and patch
+        """
+        keywords = (self.major, self.minor, self.patch)
+        options = (self.keyword_aliases, self.conventional_commits)
+        if(self._classifier is None or self._classifier.keywords 
+           != KeywordClassifier.signature(*keywords, *options)):
+            self._classifier = KeywordClassifier(*keywords, *options)
+        return self._classifier
+    
     def get_highest_version_type(self, version_types):
         """returns the highest version type in a list of Strings
 
@@ -193,13 +2742,153 @@ class SemanticVersioning:
         Returns:
             string: the highest version type mentioned in the list
         """
-        if(self.major in version_types):
-            return self.major
-        if(self.minor in version_types):
-            return self.minor
-        if(self.patch in version_types):
-            return self.patch
-     
+        # single pass over the list, stops at the first major
+        return self.classifier.highest_of(version_types)
+    
+    def classify_commit(self, rev="HEAD", chunk_size=65536):
+        """returns the highest version type of a single commit, the message 
+        is streamed from git in chunks and only read until a major keyword 
+        is found, so huge squash messages never have to fit into memory
+
+        Args:
+            rev (string, optional): the commit. Defaults to "HEAD".
+            chunk_size (int, optional): characters read at once. Defaults 
+            to 65536.
+
+        Returns:
+            string: the highest version type, None if no keyword was used
+        """
+        import subprocess
+        process = subprocess.Popen(
+            ["git", "log", "-1", "--format=%B", rev, "--"], cwd=self.dirpath, 
+            stdout=subprocess.PIPE, text=True, encoding="utf-8", 
+            errors="replace")
+        try:
+            chunks = iter(partial(process.stdout.read, chunk_size), "")
+            return self.classifier.highest_of(
+                self.classifier.iter_stream_types(chunks))
+        finally:
+            # the rest of the message isn't needed after a major keyword
+            process.stdout.close()
+            if(process.poll() is None):
+                process.terminate()
+            process.wait()
+    
+    def validate_commit_message(self, message):
+        """checks a single commit message before it is committed
+        comment lines (starting with #) and everything below the scissors 
+        line of git commit -v (the staged diff) are ignored like git does
+
+        Args:
+            message (string): the commit message
+
+        Raises:
+            MissingKeywordException: if the message uses no keyword
+
+        Returns:
+            string: the highest version type of the message
+        """
+        # the commit-msg hook runs before git cleans up the message
+        scissors = SCISSORS_PATTERN.search(message)
+        if(scissors is not None):
+            message = message[:scissors.start()]
+        if("#" in message):
+            message = "\n".join(line for line in message.splitlines() 
+                                 if not line.startswith("#"))
+        # skip commits of the GH Actions bot
+        if(self.actionsbot_flag in message):
+            return None
+        version_type = self.classifier.classify(message)
+        if(version_type is None):
+            raise MissingKeywordException(
+                "Please use the SemVer keywords in your Commit Messages")
+        return version_type
+    
+    def record_bump_note(self, rev="HEAD"):
+        """stores the highest version type of a commit in the git notes ref 
+        self.notes_ref, so the release doesn't have to parse the message
+
+        Args:
+            rev (string, optional): the commit. Defaults to "HEAD".
+
+        Returns:
+            string: the recorded version type, "none" if no keyword was used
+        """
+        import subprocess
+        output = subprocess.run(
+            ["git", "log", "-1", "--format=%H%x00%B", rev], cwd=self.dirpath, 
+            capture_output=True, text=True, check=True).stdout
+        sha, message = output.split("\0", 1)
+        # the path rules of the policy apply like in every other mode
+        version_type = self.classifier.highest_of(
+            self._classify_history([(sha, message)])) or "none"
+        subprocess.run(
+            ["git", "notes", f"--ref={self.notes_ref}", "add", "-f", "-m", 
+             version_type, rev], 
+            cwd=self.dirpath, capture_output=True, check=True)
+        return version_type
+    
+    def read_bump_notes(self):
+        """reads all version types recorded in the notes ref at once
+
+        Returns:
+            Dict(String, String): commit sha -> version type, None for 
+            commits without keyword
+        """
+        import subprocess
+        listing = subprocess.run(
+            ["git", "notes", f"--ref={self.notes_ref}", "list"], 
+            cwd=self.dirpath, capture_output=True, text=True).stdout
+        # every line: sha of the note blob, sha of the commit
+        pairs = [line.split() for line in listing.splitlines() if line]
+        if(not pairs):
+            return {}
+        # read all note blobs with a single git process
+        output = subprocess.run(
+            ["git", "cat-file", "--batch"], cwd=self.dirpath, 
+            input="\n".join(note for note, commit in pairs) + "\n", 
+            capture_output=True, text=True, check=True).stdout
+        notes = {}
+        position = 0
+        for note, commit in pairs:
+            # header: <sha> blob <size>, followed by the content
+            header_end = output.index("\n", position)
+            size = int(output[position:header_end].split()[2])
+            content = output[header_end + 1:header_end + 1 + size].strip()
+            position = header_end + 1 + size + 1
+            notes[commit] = None if content == "none" else content
+        return notes
+    
+    def get_version_types_from_notes(self, max_depth=None, since=None):
+        """returns the version types of the next release (see 
+        iter_release_history), commits with a note are not parsed again
+
+        Args:
+            max_depth (int, optional): maximum number of commits to walk. 
+            Defaults to None (no limit).
+            since (string, optional): only walk commits newer than this date. 
+            Defaults to None (no limit).
+
+        Returns:
+            List(String): version types found in the commits
+        """
+        notes = self.read_bump_notes()
+        with self._span("history"):
+            history = list(self.iter_release_history(max_depth, since))
+        # committed without the hooks
+        missing = [(sha, message) for sha, message in history 
+                   if sha not in notes]
+        with self._span("classify"):
+            missing_types = dict(zip((sha for sha, message in missing), 
+                                     self._classify_commits(missing)))
+        version_types = []
+        for sha, message in history:
+            if(sha in missing_types):
+                version_types += missing_types[sha]
+            elif(notes[sha] is not None):
+                version_types.append(notes[sha])
+        return version_types
+    
     def update_version(self, commits): 
         """
         Call this method to update the version number.
@@ -214,26 +2903,987 @@ class SemanticVersioning:
         """
         # get the list of Keywords
         version_types = self.analyze_git_commits(commits)
+        return self.update_version_from_types(version_types)
+    
+    def update_version_from_types(self, version_types):
+        """
+        updates the version number based on already analyzed version types
+        
+        Args:
+            version_types (List(String)): version types of the last commits
+
+        Raises:
+            MissingKeywordException: if the list of version types is empty
+
+        Returns:
+            string: the version type the version was updated with
+        """
         # if the List is Empty
         if(version_types == []):
             # Raise the MissingKeywordException
             raise MissingKeywordException(
                 "Please use the SemVer keywords in your Commit Messages")
-        print(version_types)
+        _logger().info("version types: %s", version_types, 
+                       extra={"version_types": version_types})
         # saves the highest version_type metioned in commit messages 
         version_type = self.get_highest_version_type(version_types)
         
         # modyfy the version number based on the selected version type
         self.modify_version_number(version_type)
+        return version_type
+
+    
+    def reload_pom(self):
+        """
+        drops the parsed pom, it is parsed again on the next use
+        e.g. after the working tree was updated by git
+        """
+        for name in ("tree", "root", "version_location"):
+            self.__dict__.pop(name, None)
+    
+    async def _run_git_async(self, *args):
+        """runs a git command without blocking the event loop
+
+        Args:
+            *args (string): arguments of the git command
+
+        Raises:
+            GitCommandError: if git fails
+
+        Returns:
+            string: output of the command
+        """
+        import asyncio
+        from git import GitCommandError
+        process = await asyncio.create_subprocess_exec(
+            "git", *args, cwd=self.dirpath, 
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        stdout, stderr = await process.communicate()
+        if(process.returncode != 0):
+            raise GitCommandError(["git", *args], process.returncode, 
+                                  stderr.decode("utf-8", "replace"))
+        return stdout.decode("utf-8", "replace")
+    
+    async def fetch_and_scan_async(self):
+        """fetches main from origin and returns the commits since the skip 
+        flag, the local history is scanned while the fetch is running
+        main is fast-forwarded to the fetched commit afterwards
+
+        Raises:
+            RuntimeError: if another branch is checked out
+
+        Returns:
+            List(Tuple(String, String)): sha and message of the commits 
+            since the skip flag
+        """
+        import asyncio
+        branch = self.main.name
+        # the fast-forward and the version commit use the working tree
+        checked_out = (await self._run_git_async(
+            "rev-parse", "--abbrev-ref", "HEAD")).strip()
+        if(checked_out != branch):
+            raise RuntimeError(
+                f"{branch} has to be checked out, not {checked_out}")
+        fetch = asyncio.create_task(
+            self._run_git_async("fetch", self.origin.name, branch))
+        # scan the local history in a thread, while the fetch is waiting 
+        # for the network
+        local_commits, flag_found = await asyncio.to_thread(
+            self.get_history_since, None, self.main.path)
+        await fetch
+        # GitPython and the history walks block, other repositories of 
+        # release_repositories_async keep running meanwhile
+        local_head = await asyncio.to_thread(lambda: self.main.commit.hexsha)
+        remote_head = (await self._run_git_async(
+            "rev-parse", "FETCH_HEAD")).strip()
+        if(remote_head == local_head):
+            return local_commits
+        if(await asyncio.to_thread(self._is_ancestor, local_head, 
+                                   remote_head)):
+            # only the fetched commits still have to be read
+            new_commits, flag_found = await asyncio.to_thread(
+                self.get_history_since, local_head, remote_head)
+            commits = new_commits if flag_found else (
+                new_commits + local_commits)
+        else:
+            # the remote history was rewritten, the local scan is useless
+            commits, flag_found = await asyncio.to_thread(
+                self.get_history_since, None, remote_head)
+        await self._run_git_async("merge", "--ff-only", remote_head)
+        # the fetched commits may have changed the pom
+        self.reload_pom()
+        return commits
+    
+    async def push_version_async(self):
+        """
+        commits the updated pom.xml with the skip flag and pushes it to 
+        origin, the flag marks the commit as the last release
+        """
+        await self._run_git_async("add", self.pom_path)
+        await self._run_git_async(
+            "commit", "-m", 
+            f"{self.actionsbot_flag} version {self.get_version()}")
+        await self._run_git_async("push", self.origin.name, self.main.name)
+    
+    async def release_async(self):
+        """fetches main, updates the version and pushes the new version
+
+        Raises:
+            MissingKeywordException: if none of the keywords was used in the 
+            fetched commits
+
+        Returns:
+            RepositoryResult: versions, bump type and commits of the release
+        """
+        import asyncio
+        history = await self.fetch_and_scan_async()
+        old_version = self.get_version()
+        # the path rules may need the changed files of every commit
+        version_types = await asyncio.to_thread(
+            self._classify_history, history)
+        bump_type = self.update_version_from_types(version_types)
+        await self.push_version_async()
+        return RepositoryResult(self.dirpath, old_version, self.get_version(), 
+                                bump_type, 
+                                [message for sha, message in history], None)
+
+# result of updating the version of a single repository in batch mode
+RepositoryResult = namedtuple("RepositoryResult", [
+    "path", "old_version", "new_version", "bump_type", "commits", "error"])
+
+class BumpResult(namedtuple("BumpResult", [
+        "old_version", "new_version", "bump_type", "counts", "commits", 
+        "timings", "written"])):
+    """
+    immutable result of SemanticVersioning.bump
+    
+    counts holds the number of matches per version type, commits the shas 
+    scanned (most recent first, empty if the version types were computed 
+    before, see bump_from_types) and timings the seconds per stage, both 
+    mappings are read-only
+    """
+    __slots__ = ()
+    
+    def __new__(cls, old_version, new_version, bump_type, counts, commits, 
+                timings, written):
+        from types import MappingProxyType
+        return super().__new__(
+            cls, old_version, new_version, bump_type, 
+            MappingProxyType(dict(counts)), tuple(commits), 
+            MappingProxyType(dict(timings)), written)
+    
+    def __reduce__(self):
+        # mapping proxies can't be pickled
+        return (BumpResult, (self.old_version, self.new_version, 
+                             self.bump_type, dict(self.counts), self.commits, 
+                             dict(self.timings), self.written))
+    
+    def to_dict(self):
+        """returns the result as dict of JSON types
+
+        Returns:
+            Dict: all fields, commits as list
+        """
+        return {"old_version": self.old_version, 
+                "new_version": self.new_version, 
+                "bump_type": self.bump_type, "counts": dict(self.counts), 
+                "commits": list(self.commits), 
+                "timings": dict(self.timings), "written": self.written}
+
+# next version of a revision, computed without writing anything
+VersionPlan = namedtuple("VersionPlan", [
+    "revision", "old_version", "new_version", "bump_type", "commits"])
+
+def plan_versions(path, revisions, workers=None):
+    """plans the next versions of many revisions of a repository on a 
+    thread pool, e.g. the heads of all open pull requests
+
+    Args:
+        path (string): directory of the maven project
+        revisions (Iterable(String)): revisions or ranges
+        workers (int, optional): number of threads. Defaults to None 
+        (chosen by ThreadPoolExecutor).
+
+    Returns:
+        List(VersionPlan): plans in the order of revisions
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    semver = SemanticVersioning(path)
+    semver.load_policy()
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(semver.plan, revisions))
+
+def bump_repository(path, max_depth=None, since=None, 
+                    history_backend="gitpython", write_mode="tree"):
+    """updates the version of a single repository, errors are returned in 
+    the result instead of being raised, so one broken repo doesn't stop a 
+    batch
+
+    Args:
+        path (string): directory of the maven project
+        max_depth (int, optional): maximum number of commits to walk. 
+        Defaults to None (no limit).
+        since (string, optional): only walk commits newer than this date. 
+        Defaults to None (no limit).
+        history_backend (string, optional): backend used to read the 
+        history. Defaults to "gitpython".
+        write_mode (string, optional): how the version is written to the 
+        pom. Defaults to "tree".
+
+    Returns:
+        RepositoryResult: versions, bump type and commits of the repository
+    """
+    old_version = None
+    commits = []
+    try:
+        semver = SemanticVersioning(path)
+        semver.load_policy()
+        semver.history_backend = history_backend
+        semver.write_mode = write_mode
+        old_version = semver.get_version()
+        history = list(semver.iter_release_history(max_depth, since))
+        commits = [message for sha, message in history]
+        bump_type = semver.update_version_from_types(
+            semver._classify_history(history))
+        return RepositoryResult(path, old_version, semver.get_version(), 
+                                bump_type, commits, None)
+    except Exception as error:
+        # only the text, not every exception can be sent between processes
+        return RepositoryResult(path, old_version, None, None, commits, 
+                                f"{type(error).__name__}: {error}")
+
+def bump_repositories(paths, workers=None, **options):
+    """updates the versions of many repositories in one process pool
+
+    Args:
+        paths (Iterable(String)): directories of the maven projects
+        workers (int, optional): number of processes. Defaults to None 
+        (number of CPUs).
+        **options: max_depth, since, history_backend and write_mode as 
+        accepted by bump_repository
+
+    Returns:
+        List(RepositoryResult): results in the order of paths
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(partial(bump_repository, **options), paths))
+
+@lru_cache(maxsize=8)
+def _chunk_classifier(keywords, aliases, conventional):
+    """returns the classifier of a pool process, it is only built once per 
+    process and policy, use classify_chunk instead
+    """
+    return KeywordClassifier(*keywords, dict(aliases), conventional)
+
+def classify_chunk(keywords, aliases, conventional, messages):
+    """classifies commit messages in a pool process
+
+    Args:
+        keywords (Tuple(String)): major, minor and patch keyword
+        aliases (Tuple(Tuple(String, String))): alias and version type pairs
+        conventional (bool): accept Conventional Commits
+        messages (List(String)): commit messages
+
+    Returns:
+        List(String): highest version type of every message, None if it 
+        has no keyword
+    """
+    classify = _chunk_classifier(keywords, aliases, conventional).classify
+    return [classify(message) for message in messages]
+
+def backfill_versions(path, output, format="csv", workers=None, 
+                      chunk_size=1000, initial_version=None):
+    """computes the version every commit of the branch was released with
+    the flagged commits on the first-parent history are the releases, a 
+    release holds every commit reachable from its flag (through all 
+    parents, e.g. the commits of merged branches), that is not part of an 
+    older release, like the --graph scan
+    the messages are classified in chunks on a process pool and the 
+    versions follow from a single scan over the bump types of the releases 
+    afterwards
+    path rules of the policy are not applied
+
+    Args:
+        path (string): directory of the maven project
+        output (string): path of the table
+        format (string, optional): "csv" or "sqlite". Defaults to "csv".
+        workers (int, optional): number of processes. Defaults to None 
+        (number of CPUs).
+        chunk_size (int, optional): messages per task. Defaults to 1000.
+        initial_version (string, optional): version before the first 
+        release. Defaults to None (version of the first pom.xml of the 
+        branch).
+
+    Raises:
+        ValueError: if no initial_version is given and no commit of the 
+        branch has a pom.xml
+
+    Returns:
+        int: number of commits written (oldest release first), columns of 
+        the table: sha, version_type of the commit, version and released 
+        (0 for the commits after the last release)
+    """
+    import subprocess
+    from concurrent.futures import ProcessPoolExecutor
+    if(format not in ("csv", "sqlite")):
+        raise ValueError(f"Unknown backfill format: {format}")
+    semver = SemanticVersioning(path)
+    semver.load_policy()
+    classifier = semver.classifier
+    options = ((semver.major, semver.minor, semver.patch), 
+               tuple(sorted(semver.keyword_aliases.items())), 
+               semver.conventional_commits)
+    shas = [] # parents before their children
+    parents = {} # sha -> shas of the parents, the first parent first
+    flagged = set()
+    futures = []
+    # the parents are part of the sha field: "<sha> <parent> <parent>"
+    process = subprocess.Popen(
+        ["git", "log", "--topo-order", "--reverse", 
+         "--format=%H %P%x00%B%x00", semver.main.path, "--"], 
+        cwd=path, stdout=subprocess.PIPE)
+    with ProcessPoolExecutor(workers) as executor:
+        chunk = []
+        for commit, message in iter_log_records(process.stdout):
+            sha, *commit_parents = commit.split()
+            parents[sha] = commit_parents
+            if(semver.actionsbot_flag in message):
+                flagged.add(sha)
+                # the release commit of the bot has no version type
+                message = ""
+            shas.append(sha)
+            chunk.append(message)
+            if(len(chunk) == chunk_size):
+                futures.append(executor.submit(classify_chunk, *options, 
+                                               chunk))
+                chunk = []
+        if(chunk):
+            futures.append(executor.submit(classify_chunk, *options, chunk))
+        process.stdout.close()
+        if(process.wait() != 0):
+            raise RuntimeError("git log failed")
+        version_types = []
+        for future in futures:
+            version_types += future.result()
+    if(initial_version is None and shas):
+        # e.g. a README-only initial commit has no pom.xml yet
+        pom_commits = subprocess.run(
+            ["git", "rev-list", "--reverse", semver.main.path, "--", 
+             "pom.xml"], 
+            cwd=path, capture_output=True, text=True, check=True).stdout
+        if(not pom_commits):
+            raise ValueError("No commit has a pom.xml, pass initial_version")
+        initial_version = semver.plan(pom_commits.split()[0]).old_version
+    # releases on the first-parent history, oldest first
+    chain = []
+    sha = shas[-1] if shas else None
+    while(sha is not None):
+        chain.append(sha)
+        # the parents of a shallow clone may be missing
+        sha = parents[sha][0] if parents[sha] else None
+        if(sha not in parents):
+            sha = None
+    releases = [sha for sha in reversed(chain) if sha in flagged]
+    heads = releases[:]
+    if(chain and chain[0] not in flagged):
+        # commits after the last release
+        heads.append(chain[0])
+    # every commit belongs to the oldest release reaching it
+    release_of = {}
+    for index, head in enumerate(heads):
+        stack = [head]
+        while(stack):
+            sha = stack.pop()
+            if(sha in release_of):
+                continue
+            release_of[sha] = index
+            stack.extend(parents.get(sha, ()))
+    members = [[] for head in heads]
+    for position, sha in enumerate(shas):
+        members[release_of[sha]].append(position)
+    # scan over the releases: every release bumps the version of the last
+    rows = []
+    version = initial_version
+    for index, positions in enumerate(members):
+        released = index < len(releases)
+        bump_type = classifier.highest_of(
+            version_types[position] for position in positions)
+        if(bump_type is not None):
+            version = semver.compute_next_version(version, bump_type)
+        for position in positions:
+            rows.append((shas[position], version_types[position], version, 
+                         int(released)))
+    if(format == "csv"):
+        import csv
+        with open(output, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["sha", "version_type", "version", "released"])
+            writer.writerows(rows)
+    else:
+        import sqlite3
+        connection = sqlite3.connect(output)
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS versions")
+            connection.execute(
+                "CREATE TABLE versions (sha TEXT PRIMARY KEY, "
+                "version_type TEXT, version TEXT, released INTEGER)")
+            connection.executemany(
+                "INSERT INTO versions VALUES (?, ?, ?, ?)", rows)
+        connection.close()
+    return len(rows)
+
+async def release_repositories_async(paths, limit=8):
+    """fetches, updates and pushes many repositories concurrently
+
+    Args:
+        paths (Iterable(String)): directories of the maven projects
+        limit (int, optional): maximum number of repositories handled at 
+        the same time. Defaults to 8.
+
+    Returns:
+        List(RepositoryResult): results in the order of paths
+    """
+    import asyncio
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def release(path):
+        async with semaphore:
+            try:
+                semver = SemanticVersioning(path)
+                # like a single repository, the policy file is honored
+                semver.load_policy()
+                return await semver.release_async()
+            except Exception as error:
+                return RepositoryResult(path, None, None, None, [], 
+                                        f"{type(error).__name__}: {error}")
+    
+    return list(await asyncio.gather(*(release(path) for path in paths)))
+
+class VersioningDaemon:
+    """
+    long running service, that keeps SemanticVersioning objects of many 
+    repositories warm and answers requests over a local Unix socket
+    
+    Every repository remembers the last commit scanned and the highest 
+    version type since the skip flag, so new commits are the only thing 
+    read on the next request. Repositories not used for a while are 
+    evicted (least recently used first).
+    
+    Requests and responses are single lines of JSON:
+        {"op": "next_version", "repo": "/path/to/repo"}
+        {"op": "apply_bump", "repo": "/path/to/repo"}
+    """
+    def __init__(self, max_repositories=64):
+        """
+        Args:
+            max_repositories (int, optional): number of repositories kept 
+            warm. Defaults to 64.
+        """
+        import threading
+        self.max_repositories = max_repositories
+        # path -> state of the repository, least recently used first
+        self.repositories = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _get_state(self, path):
+        """returns the warm state of a repository, creates it if needed
+
+        Args:
+            path (string): directory of the maven project
+
+        Returns:
+            Dict: "semver", "head", "highest", "pom_mtime" and "lock"
+        """
+        import threading
+        path = os.path.realpath(path)
+        with self._lock:
+            state = self.repositories.get(path)
+            if(state is None):
+                semver = SemanticVersioning(path)
+                # the policy is only read once per warm repository
+                semver.load_policy()
+                state = {"semver": semver, "head": None, 
+                         "highest": None, "pom_mtime": None, 
+                         "lock": threading.RLock()}
+                self.repositories[path] = state
+                # evict the repository used least recently
+                while(len(self.repositories) > self.max_repositories):
+                    self.repositories.popitem(last=False)
+            else:
+                self.repositories.move_to_end(path)
+            return state
+    
+    def _refresh(self, state):
+        """reads the commits pushed since the last request and reloads the 
+        pom, if it was changed on disk
+
+        Args:
+            state (Dict): state of the repository
+        """
+        semver = state["semver"]
+        head = semver.main.commit.hexsha
+        if(head != state["head"]):
+            if(state["head"] is not None 
+               and semver._is_ancestor(state["head"], head)):
+                # only the new commits have to be read
+                history, flag_found = semver.get_history_since(
+                    state["head"], head)
+                version_types = semver._classify_history(history)
+                # a flag ends the release, older results don't count anymore
+                if(not flag_found):
+                    version_types.append(state["highest"])
+            else:
+                # first request or rewritten history
+                history, flag_found = semver.get_history_since(None, head)
+                version_types = semver._classify_history(history)
+            state["highest"] = semver.get_highest_version_type(version_types)
+            state["head"] = head
+        mtime = os.stat(semver.pom_path).st_mtime_ns
+        if(mtime != state["pom_mtime"]):
+            semver.reload_pom()
+            state["pom_mtime"] = mtime
+    
+    def next_version(self, path):
+        """computes the next version of a repository without changing it
+
+        Args:
+            path (string): directory of the maven project
+
+        Raises:
+            MissingKeywordException: if no keyword was used since the flag
+
+        Returns:
+            Dict: "version", "next_version" and "bump_type"
+        """
+        state = self._get_state(path)
+        with state["lock"]:
+            self._refresh(state)
+            semver = state["semver"]
+            if(state["highest"] is None):
+                raise MissingKeywordException(
+                    "Please use the SemVer keywords in your Commit Messages")
+            version = semver.get_version()
+            return {"version": version, "bump_type": state["highest"], 
+                    "next_version": semver.compute_next_version(
+                        version, state["highest"])}
+    
+    def apply_bump(self, path):
+        """updates the version in the pom of a repository
+
+        Args:
+            path (string): directory of the maven project
+
+        Raises:
+            MissingKeywordException: if no keyword was used since the flag
+
+        Returns:
+            Dict: "version" (old), "next_version" (new) and "bump_type"
+        """
+        state = self._get_state(path)
+        with state["lock"]:
+            result = self.next_version(path)
+            semver = state["semver"]
+            semver.set_version(result["next_version"])
+            state["pom_mtime"] = os.stat(semver.pom_path).st_mtime_ns
+            # the bump is used up, until new commits arrive
+            state["highest"] = None
+            return result
+    
+    def handle(self, request):
+        """answers a single request
+
+        Args:
+            request (Dict): "op" and "repo" of the request
+
+        Returns:
+            Dict: the result and "ok": True or "ok": False and the "error"
+        """
+        try:
+            match(request.get("op")):
+                case "next_version":
+                    result = self.next_version(request["repo"])
+                case "apply_bump":
+                    result = self.apply_bump(request["repo"])
+                case op:
+                    raise ValueError(f"Unknown operation: {op}")
+        except Exception as error:
+            return {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        return {"ok": True, **result}
+    
+    def serve(self, socket_path):
+        """answers requests on a Unix socket until the process is stopped
+
+        Args:
+            socket_path (string): path of the socket file
+        """
+        self.create_server(socket_path).serve_forever()
+    
+    def create_server(self, socket_path):
+        """creates the server for a Unix socket, every connection is handled 
+        in its own thread and may send many requests
+
+        Args:
+            socket_path (string): path of the socket file
+
+        Returns:
+            socketserver.ThreadingUnixStreamServer: the server
+        """
+        import socketserver
+        daemon = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except ValueError as error:
+                        response = {"ok": False, 
+                                    "error": f"Invalid request: {error}"}
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+        
+        # a socket file left behind by a stopped daemon
+        if(os.path.exists(socket_path)):
+            os.unlink(socket_path)
+        server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+        server.daemon_threads = True
+        return server
+
+def daemon_request(socket_path, op, repo):
+    """sends a single request to a running daemon
+
+    Args:
+        socket_path (string): path of the daemon's socket
+        op (string): "next_version" or "apply_bump"
+        repo (string): directory of the maven project
+
+    Returns:
+        Dict: response of the daemon
+    """
+    import socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(
+            json.dumps({"op": op, "repo": repo}).encode() + b"\n")
+        with connection.makefile("rb") as response:
+            return json.loads(response.readline())
+
+# line of git commit -v, the diff below it is not part of the message
+SCISSORS_PATTERN = re.compile(r"^\S -{24} >8 -{24}$", re.MULTILINE)
+
+def run_commit_msg_hook(message_path):
+    """commit-msg hook, rejects a commit message without a keyword
+
+    Args:
+        message_path (string): file with the commit message, passed by git
+
+    Returns:
+        int: exit code, 1 rejects the commit
+    """
+    with open(message_path, encoding="utf-8") as file:
+        message = file.read()
+    semver = SemanticVersioning()
+    semver.load_policy()
+    try:
+        semver.validate_commit_message(message)
+    except MissingKeywordException as error:
+        print(f"{error}, e.g. fix(scope): text", file=sys.stderr)
+        return 1
+    return 0
+
+def install_hooks(path, force=False):
+    """installs the commit-msg and post-commit hooks calling this script 
+    into the hooks directory of git (core.hooksPath, if it is set)
+
+    Args:
+        path (string): directory of the repo
+        force (bool, optional): replace existing hooks of other tools. 
+        Defaults to False.
+
+    Raises:
+        FileExistsError: if another hook exists and force is False, no hook 
+        is installed then
+
+    Returns:
+        string: the hooks directory
+    """
+    import subprocess
+    hooks_dir = subprocess.run(
+        ["git", "rev-parse", "--path-format=absolute", "--git-path", 
+         "hooks"], 
+        cwd=path, capture_output=True, text=True, check=True).stdout.strip()
+    script = os.path.abspath(__file__)
+    hooks = {}
+    for name, arguments in [("commit-msg", '--commit-msg "$1"'), 
+                            ("post-commit", "--post-commit")]:
+        hooks[os.path.join(hooks_dir, name)] = (
+            f'#!/bin/sh\nexec "{sys.executable}" "{script}" {arguments}\n')
+    # check all hooks first, so nothing is half installed
+    for hook, content in hooks.items():
+        if(force or not os.path.exists(hook)):
+            continue
+        with open(hook, encoding="utf-8", errors="replace") as file:
+            # installed before, e.g. by an older run
+            if(file.read() == content):
+                continue
+        raise FileExistsError(
+            f"{hook} already exists, use --force to replace it")
+    os.makedirs(hooks_dir, exist_ok=True)
+    for hook, content in hooks.items():
+        with open(hook, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.chmod(hook, 0o755)
+    return hooks_dir
+
+def read_manifest(manifest_path):
+    """reads a manifest file with one repository path per line
+    empty lines and lines starting with # are skipped, relative paths are 
+    relative to the manifest
+
+    Args:
+        manifest_path (string): path of the manifest file
+
+    Returns:
+        List(String): paths of the repositories
+    """
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, encoding="utf-8") as file:
+        return [os.path.join(directory, line.strip()) for line in file 
+                if line.strip() and not line.strip().startswith("#")]
             
-# if this file is executed
-if __name__ == "__main__":
+def main(argv=None):
+    """command line entry point, updates the version of the maven project in 
+    the current working directory
+
+    Args:
+        argv (List(String), optional): command line arguments. 
+        Defaults to None (sys.argv is used).
+
+    Returns:
+        int: exit code
+    """
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="update the pom.xml version based on git commits")
+    # bounds for walking the history, useful on very long histories
+    parser.add_argument("--max-depth", type=int, default=None,
+        help="maximum number of commits to scan for the skip flag")
+    parser.add_argument("--since", default=None,
+        help="only scan commits newer than this date, e.g. '2 weeks ago'")
+    parser.add_argument("--backend", choices=["gitpython", "log"],
+        default="gitpython", help="backend used to read the history")
+    parser.add_argument("--write-mode", choices=["tree", "inplace"],
+        default="tree", help="rewrite the whole pom or only the version")
+    parser.add_argument("--reactor", action="store_true",
+        help="update all modules of a multi module project")
+    parser.add_argument("--branch", default="main",
+        help="branch the releases are made from")
+    parser.add_argument("--graph", action="store_true",
+        help="scan all commits after the last release, also on merged "
+             "branches")
+    parser.add_argument("--tags", action="store_true",
+        help="use semver tags (e.g. v1.4.2) as release anchors")
+    parser.add_argument("--tag-prefix", default="v",
+        help="prefix of the release tags")
+    parser.add_argument("--changelog", metavar="PATH",
+        help="append the release notes to this file, e.g. CHANGELOG.md")
+    parser.add_argument("--changelog-format", choices=["markdown", "json"],
+        default="markdown", help="format of the changelog")
+    parser.add_argument("--package", nargs="?", const="", metavar="DIR",
+        help="only collect the built jar and zip files of the pom version "
+             "into DIR/<version> (default: release/)")
+    parser.add_argument("--plan", nargs="+", metavar="RANGE",
+        help="only print the next version of revisions or ranges, e.g. "
+             "main..pr-head, nothing is written")
+    parser.add_argument("--backfill", metavar="PATH",
+        help="write the version of every commit on the branch to a table")
+    parser.add_argument("--backfill-format", choices=["csv", "sqlite"],
+        default="csv", help="format of the backfill table")
+    parser.add_argument("--json", action="store_true",
+        help="print the result as JSON, events are logged to stderr")
+    parser.add_argument("--write-commit-graph", action="store_true",
+        help="write the commit-graph file of the repo before scanning")
+    parser.add_argument("--workers", type=int, default=None,
+        help="number of threads (reactor) or processes (batch) used")
+    # many repositories in a single run
+    parser.add_argument("--batch", nargs="+", metavar="PATH", default=[],
+        help="update the versions of these repositories")
+    parser.add_argument("--manifest", 
+        help="file listing the repositories to update, one per line")
+    parser.add_argument("--push", action="store_true",
+        help="fetch main from origin first, push the new version after")
+    # git hooks validating and recording the keywords of every commit
+    parser.add_argument("--commit-msg", metavar="FILE",
+        help="commit-msg hook: reject messages without a keyword")
+    parser.add_argument("--post-commit", action="store_true",
+        help="post-commit hook: record the version type in git notes")
+    parser.add_argument("--install-hooks", action="store_true",
+        help="install the commit-msg and post-commit hooks")
+    parser.add_argument("--force", action="store_true",
+        help="let --install-hooks replace existing hooks of other tools")
+    parser.add_argument("--notes", action="store_true",
+        help="use the version types recorded by the post-commit hook")
+    # warm repositories for many requests
+    parser.add_argument("--daemon", metavar="SOCKET",
+        help="serve version requests on this Unix socket")
+    parser.add_argument("--daemon-repositories", type=int, default=64,
+        help="number of repositories the daemon keeps warm")
+    # structured events and measurements
+    parser.add_argument("--log-level", default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="DEBUG also logs every commit read")
+    parser.add_argument("--profile-json", metavar="PATH",
+        help="write timings and counters of the stages to a JSON file")
+    parser.add_argument("--profile-dump", metavar="PATH",
+        help="write a cProfile dump of the stages (pstats format)")
+    # incremental scanning for reruns of the same pipeline
+    parser.add_argument("--cache", action="store_true",
+        help="cache scan results in .git/semver-cache for later runs")
+    parser.add_argument("--cache-size", type=int, default=10000,
+        help="maximum number of commits kept in the cache")
+    args = parser.parse_args(argv)
+    # hooks run on every commit, so they return before anything else
+    if(args.commit_msg):
+        return run_commit_msg_hook(args.commit_msg)
+    if(args.post_commit):
+        semver = SemanticVersioning()
+        semver.load_policy()
+        semver.record_bump_note()
+        return 0
+    if(args.install_hooks):
+        try:
+            install_hooks(os.getcwd(), args.force)
+        except FileExistsError as error:
+            print(error, file=sys.stderr)
+            return 1
+        return 0
+    import logging
+    # only the events of this script, not the ones of GitPython
+    logger = _logger()
+    logger.setLevel(args.log_level)
+    # stdout only holds the JSON result in JSON mode
+    logger.addHandler(logging.StreamHandler(
+        sys.stderr if args.json else sys.stdout))
+    if(args.daemon):
+        VersioningDaemon(args.daemon_repositories).serve(args.daemon)
+        return 0
+    if(args.backfill):
+        count = backfill_versions(os.getcwd(), args.backfill, 
+                                  args.backfill_format, args.workers)
+        print(f"{count} commits written to {args.backfill}")
+        return 0
+    if(args.plan):
+        plans = plan_versions(os.getcwd(), args.plan, args.workers)
+        if(args.json):
+            print(json.dumps([plan._asdict() for plan in plans]))
+            return 0
+        for plan in plans:
+            print(f"{plan.revision}: {plan.old_version} -> "
+                  f"{plan.new_version} ({plan.bump_type})")
+        return 0
+    if(args.batch or args.manifest):
+        paths = list(args.batch)
+        if(args.manifest):
+            paths += read_manifest(args.manifest)
+        if(args.push):
+            import asyncio
+            results = asyncio.run(
+                release_repositories_async(paths, args.workers or 8))
+        else:
+            results = bump_repositories(
+                paths, args.workers, max_depth=args.max_depth, 
+                since=args.since, history_backend=args.backend, 
+                write_mode=args.write_mode)
+        if(args.json):
+            print(json.dumps([result._asdict() for result in results]))
+        else:
+            for result in results:
+                if(result.error is None):
+                    print(f"{result.path}: {result.old_version} -> "
+                          f"{result.new_version} ({result.bump_type})")
+                else:
+                    print(f"{result.path}: {result.error}")
+        # fail the run, if a single repository failed
+        return 1 if any(result.error for result in results) else 0
     # create a Semantic Versioning Object
     semver = SemanticVersioning()
-    print(f"old version: {semver.get_version()}")
-    # get commits
-    commits = semver.get_commits_til_tag()
-    # Updates the Version number
-    semver.update_version(commits)
-    print(f"new version: {semver.get_version()}")
-    
\ No newline at end of file
+    semver.load_policy()
+    semver.history_backend = args.backend
+    semver.branch = args.branch
+    semver.graph_walk = args.graph
+    semver.tag_anchors = args.tags
+    semver.tag_prefix = args.tag_prefix
+    semver.write_mode = args.write_mode
+    semver.reactor = args.reactor
+    semver.workers = args.workers
+    if(args.profile_json or args.profile_dump):
+        semver.instrumentation = Instrumentation(
+            profile=args.profile_dump is not None)
+    if(args.package is not None):
+        # runs after the build, the version is already updated
+        manifest = semver.package_release(args.package or None)
+        for artifact in manifest["artifacts"]:
+            print(f"{artifact['sha256']}  {artifact['name']}")
+        return 0
+    if(args.push):
+        import asyncio
+        result = asyncio.run(semver.release_async())
+        print(f"old version: {result.old_version}")
+        print(f"new version: {result.new_version}")
+        return 0
+    if(args.write_commit_graph):
+        semver.write_commit_graph()
+    commits = None # only read, if no cache or notes are used
+    version_types = None # computed before by the notes or cache mode
+    start = time.perf_counter()
+    if(args.notes):
+        # the messages were classified by the post-commit hook
+        version_types = semver.get_version_types_from_notes(
+            args.max_depth, args.since)
+    elif(args.cache):
+        # only commits newer than the last run are read
+        cache = ScanCache(
+            os.path.join(semver.repo.git_dir, "semver-cache"), 
+            args.cache_size)
+        version_types = semver.get_version_types_cached(
+            cache, args.max_depth, args.since)
+    scan_seconds = time.perf_counter() - start
+    if(args.json):
+        # nothing but the result is printed, no keyword is no error
+        if(version_types is None):
+            result = semver.bump(args.max_depth, args.since)
+        else:
+            result = semver.bump_from_types(
+                version_types, timings={"history": scan_seconds})
+        print(json.dumps(result.to_dict()))
+        released = result.bump_type is not None
+    else:
+        print(f"old version: {semver.get_release_version()}")
+        if(version_types is not None):
+            semver.update_version_from_types(version_types)
+        elif(semver.path_rules):
+            # the changed files of every commit are needed
+            version_types = semver.get_version_types(
+                args.max_depth, args.since)
+            semver.update_version_from_types(version_types)
+        else:
+            # get commits
+            commits = semver.get_commits_til_tag(args.max_depth, args.since)
+            # Updates the Version number
+            semver.update_version(commits)
+        print(f"new version: {semver.get_version()}")
+        released = True
+    if(args.changelog and released):
+        semver.write_changelog(args.changelog, commits, 
+                               args.changelog_format, args.max_depth, 
+                               args.since)
+    if(args.profile_json):
+        semver.instrumentation.export_json(args.profile_json)
+    if(args.profile_dump):
+        semver.instrumentation.dump_profile(args.profile_dump)
+    return 0
+
+# if this file is executed
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+benchmarks for the hot paths of maven_semantic_versioning: walking the
+history, classifying commit messages and rewriting the pom.xml
+
+how to use: "python semantic_versioning_benchmark.py" in cmd
+    --save baseline.json      stores the results as baseline
+    --compare baseline.json   flags results slower than the baseline
+
+All data (git repos, poms, commit messages) is generated locally in a
+temporary directory.
+"""
+# measuring time and memory
+import time
+import tracemalloc
+# generating the test data
+import os
+import subprocess
+import tempfile
+import random
+# command line and result files
+import argparse
+import json
+import sys
+
+import maven_semantic_versioning as semantic_versioning
+
+# differences below these are noise and never reported as regression
+MIN_TIME_DIFFERENCE = 0.0005 # seconds
+MIN_MEMORY_DIFFERENCE = 64 * 1024 # bytes
+
+# keywords used for the synthetic commit messages
+KEYWORDS = ["fix", "fix", "fix", "minor", "major"]
+
+def generate_repo(path, commits, flag_depth):
+    """creates a git repo with a linear history on main using git fast-import
+
+    Args:
+        path (string): directory of the new repo
+        commits (int): number of commits
+        flag_depth (int): number of commits after the last flagged commit
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", path], check=True)
+    process = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=path,
+                               stdin=subprocess.PIPE)
+    flag_index = commits - flag_depth - 1
+    chunk = []
+    for index in range(commits):
+        message = f"{KEYWORDS[index % len(KEYWORDS)]}(bench): commit {index}"
+        if(index == flag_index):
+            message += " [skip semVer]"
+        message = message.encode("utf-8") + b"\n"
+        # without a from command the commit continues the branch
+        chunk.append(b"commit refs/heads/main\ncommitter bench <bench@local> "
+                     b"%d +0000\ndata %d\n%s\n"
+                     % (1600000000 + index, len(message), message))
+        if(len(chunk) == 10000):
+            process.stdin.write(b"".join(chunk))
+            chunk = []
+    process.stdin.write(b"".join(chunk))
+    process.stdin.close()
+    if(process.wait() != 0):
+        raise RuntimeError("git fast-import failed")
+
+def generate_pom(path, size):
+    """creates a pom.xml of roughly the given size, most of it dependencies
+
+    Args:
+        path (string): path of the new pom.xml
+        size (int): size of the pom in bytes
+    """
+    head = ("<?xml version='1.0' encoding='utf-8'?>\n"
+            '<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+            "  <modelVersion>4.0.0</modelVersion>\n"
+            "  <groupId>bench</groupId>\n  <artifactId>bench</artifactId>\n"
+            "  <version>1.0.0</version>\n  <dependencies>\n")
+    tail = "  </dependencies>\n</project>\n"
+    parts = [head]
+    written = len(head) + len(tail)
+    index = 0
+    while(written < size):
+        # comments are kept by the inplace write, but dropped by the tree
+        dependency = (f"    <!-- dependency {index} -->\n"
+                      f"    <dependency>\n"
+                      f"      <groupId>org.bench</groupId>\n"
+                      f"      <artifactId>artifact-{index}</artifactId>\n"
+                      f"      <version>{index % 10}.{index % 7}.0</version>\n"
+                      f"    </dependency>\n")
+        parts.append(dependency)
+        written += len(dependency)
+        index += 1
+    parts.append(tail)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("".join(parts))
+
+def generate_squashed_messages(count, lines, seed=0):
+    """creates squashed merge messages like the ones GitHub produces
+
+    Args:
+        count (int): number of messages
+        lines (int): number of squashed commits per message
+        seed (int, optional): seed of the random generator. Defaults to 0.
+
+    Returns:
+        List(String): the messages
+    """
+    generator = random.Random(seed)
+    messages = []
+    for index in range(count):
+        body = "\n".join(
+            f"* {generator.choice(KEYWORDS[:-1])}(part {line}): change {line}"
+            for line in range(lines))
+        messages.append(f"Merge pull request (#{index})\n\n{body}")
+    # a few messages of the corpus trigger a major release
+    for index in range(0, count, 100):
+        messages[index] += "\n* major(api): breaking change"
+    return messages
+
+def percentile(samples, fraction):
+    """returns a percentile of a sorted list (nearest rank)
+
+    Args:
+        samples (List(float)): sorted samples
+        fraction (float): percentile between 0 and 1
+
+    Returns:
+        float: the percentile
+    """
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return samples[index]
+
+def measure(name, function, items, repeat):
+    """runs a benchmark and collects its statistics
+
+    Args:
+        name (string): name of the benchmark
+        function (Callable): code measured, called without arguments
+        items (int): number of items handled per call, for the throughput
+        repeat (int): number of timed runs
+
+    Returns:
+        Dict: name, throughput (items/s), p50 and p99 latency (s) and peak
+        memory (bytes)
+    """
+    # warm up caches, imports and the page cache
+    function()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    # measured in a separate run, tracemalloc slows down the code
+    tracemalloc.start()
+    function()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    p50 = percentile(samples, 0.5)
+    result = {
+        "name": name,
+        "throughput": items / p50 if p50 else float("inf"),
+        "p50": p50,
+        "p99": percentile(samples, 0.99),
+        "peak_memory": peak_memory,
+    }
+    print(f"{name:<48} {result['throughput']:>14.0f}/s "
+          f"p50 {p50 * 1000:>9.3f}ms p99 {result['p99'] * 1000:>9.3f}ms "
+          f"peak {peak_memory / 1024:>9.0f}KiB")
+    return result
+
+def benchmark_history(workdir, commit_counts, flag_depths, repeat):
+    """benchmarks walking the history until the skip flag
+
+    Args:
+        workdir (string): directory for the generated repos
+        commit_counts (List(int)): sizes of the generated repos
+        flag_depths (List(int)): number of commits after the flag
+        repeat (int): number of timed runs
+
+    Returns:
+        List(Dict): results of the benchmarks
+    """
+    results = []
+    for commits in commit_counts:
+        for flag_depth in flag_depths:
+            if(flag_depth >= commits):
+                continue
+            path = os.path.join(workdir, f"repo-{commits}-{flag_depth}")
+            generate_repo(path, commits, flag_depth)
+            semver = semantic_versioning.SemanticVersioning(path)
+            for backend in ["gitpython", "log"]:
+                semver.history_backend = backend
+                results.append(measure(
+                    f"history/{backend}/commits={commits}/flag={flag_depth}",
+                    lambda: list(semver.iter_commits_til_tag()),
+                    flag_depth, repeat))
+    return results
+
+def benchmark_classification(message_counts, lines, repeat):
+    """benchmarks classifying squashed merge messages
+
+    Args:
+        message_counts (List(int)): sizes of the generated corpora
+        lines (int): number of squashed commits per message
+        repeat (int): number of timed runs
+
+    Returns:
+        List(Dict): results of the benchmarks
+    """
+    results = []
+    semver = semantic_versioning.SemanticVersioning.from_version("1.0.0")
+    for count in message_counts:
+        messages = generate_squashed_messages(count, lines)
+        results.append(measure(
+            f"classify/analyze_git_commits/messages={count}",
+            lambda: semver.get_highest_version_type(
+                semver.analyze_git_commits(messages)),
+            count, repeat))
+        results.append(measure(
+            f"classify/count/messages={count}",
+            lambda: semver.classifier.count(messages), count, repeat))
+    return results
+
+def benchmark_pom(workdir, sizes, repeat):
+    """benchmarks writing a new version to the pom.xml
+
+    Args:
+        workdir (string): directory for the generated poms
+        sizes (List(int)): sizes of the generated poms in bytes
+        repeat (int): number of timed runs
+
+    Returns:
+        List(Dict): results of the benchmarks
+    """
+    results = []
+    for size in sizes:
+        path = os.path.join(workdir, f"pom-{size}")
+        os.makedirs(path)
+        generate_pom(os.path.join(path, "pom.xml"), size)
+        for write_mode in ["tree", "inplace"]:
+            semver = semantic_versioning.SemanticVersioning(path)
+            semver.write_mode = write_mode
+            results.append(measure(
+                f"pom/{write_mode}/bytes={size}",
+                lambda: semver.set_version("1.0.1"), size, repeat))
+        # parsing is part of every run of the script
+        results.append(measure(
+            f"pom/parse/bytes={size}",
+            lambda: semantic_versioning.SemanticVersioning(path).get_version(),
+            size, repeat))
+    return results
+
+def compare(results, baseline, threshold):
+    """compares results with a baseline
+
+    Args:
+        results (List(Dict)): results of this run
+        baseline (List(Dict)): results of the baseline run
+        threshold (float): allowed slowdown, 0.2 -> 20% slower is allowed
+
+    Returns:
+        List(String): descriptions of all regressions
+    """
+    baseline = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        old = baseline.get(result["name"])
+        if(old is None):
+            continue
+        for metric, noise in [("p50", MIN_TIME_DIFFERENCE),
+                              ("p99", MIN_TIME_DIFFERENCE),
+                              ("peak_memory", MIN_MEMORY_DIFFERENCE)]:
+            if(result[metric] > old[metric] * (1 + threshold)
+               and result[metric] - old[metric] > noise):
+                regressions.append(
+                    f"{result['name']}: {metric} {old[metric]:.6g} -> "
+                    f"{result[metric]:.6g}")
+    return regressions
+
+def main(argv=None):
+    """command line entry point of the benchmark suite
+
+    Args:
+        argv (List(String), optional): command line arguments.
+        Defaults to None (sys.argv is used).
+
+    Returns:
+        int: exit code, 1 if a regression was found
+    """
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commits", type=int, nargs="+",
+        default=[1000, 100000, 1000000], help="sizes of the generated repos")
+    parser.add_argument("--flag-depths", type=int, nargs="+",
+        default=[20, 1000], help="commits after the flagged commit")
+    parser.add_argument("--messages", type=int, nargs="+",
+        default=[1000, 100000], help="sizes of the message corpora")
+    parser.add_argument("--lines", type=int, default=30,
+        help="squashed commits per message")
+    parser.add_argument("--pom-sizes", type=int, nargs="+",
+        default=[1024, 100 * 1024, 10 * 1024 * 1024],
+        help="sizes of the generated poms in bytes")
+    parser.add_argument("--repeat", type=int, default=20,
+        help="number of timed runs per benchmark")
+    parser.add_argument("--save", help="store the results in this file")
+    parser.add_argument("--compare", help="baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2,
+        help="allowed slowdown compared to the baseline")
+    args = parser.parse_args(argv)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        results += benchmark_history(
+            workdir, args.commits, args.flag_depths, args.repeat)
+        results += benchmark_classification(
+            args.messages, args.lines, args.repeat)
+        results += benchmark_pom(workdir, args.pom_sizes, args.repeat)
+    if(args.save):
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if(args.compare):
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if(regressions):
+            return 1
+    return 0
+
+# if this file is executed
+if __name__ == "__main__":
+    sys.exit(main())
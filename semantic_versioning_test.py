@@ -2,9 +2,42 @@ import unittest
 # how to use: "python -m unittest semver/semantic_versioning_test.py" in cmd
 
 import re
+import os
+import tempfile
+import io
+import subprocess
+import asyncio
+import threading
+import sys
+import contextlib
+import json
+import pstats
+import hashlib
+import csv
+import sqlite3
+import pickle
 # import the file and all modules in it
 import semver.maven_semantic_versioning as semantic_versioning
 
+def create_repo(path, messages, version="1.0.0"):
+    """creates a maven project in a new git repo with one commit per message
+
+    Args:
+        path (string): directory of the new repo
+        messages (List(String)): commit messages, oldest first
+        version (string, optional): version in the pom. Defaults to "1.0.0".
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", path], check=True)
+    with open(os.path.join(path, "pom.xml"), "w") as file:
+        file.write('<project xmlns="http://maven.apache.org/POM/4.0.0">'
+                   f"<version>{version}</version></project>")
+    git = ["git", "-C", path, "-c", "user.name=test", 
+           "-c", "user.email=test@test"]
+    subprocess.run(git + ["add", "pom.xml"], check=True)
+    for message in messages:
+        subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", message], 
+                       check=True)
+
 class TestMavenSemanticVersioning(unittest.TestCase):
     def setUp(self):
         self.semver = semantic_versioning.SemanticVersioning()
@@ -89,10 +122,128 @@ class TestMavenSemanticVersioning(unittest.TestCase):
             "(deep): test): test): test"]
         self.regex_keywords = [self.patch]
         
+        # pom with versions that must not be mistaken for the project version
+        self.pom = (b"<?xml version='1.0' encoding='utf-8'?>\n"
+            b"<!-- <version>9.9.9</version> -->\n"
+            b'<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+            b"  <parent>\n    <version>3.0.0</version>\n  </parent>\n"
+            b"  <version>1.2.3</version>\n"
+            b"  <dependencies><dependency>\n"
+            b"    <version>4.5.6</version>\n"
+            b"  </dependency></dependencies>\n"
+            b"</project>\n")
+        
         
         
         
     
+    # repo and pom are only opened when they are needed
+    def test_lazy_loading(self):
+        semver = semantic_versioning.SemanticVersioning()
+        semver.analyze_git_commits(self.major_1)
+        self.assertNotIn("repo", vars(semver))
+        self.assertNotIn("tree", vars(semver))
+    
+    def test_from_version(self):
+        semver = semantic_versioning.SemanticVersioning.from_version("1.0.0")
+        semver.update_version(self.minor_1)
+        self.assertEqual("1.1.0", semver.get_version())
+        self.assertIsNone(semver.pom_path)
+    
+    def test_from_pom_string(self):
+        semver = semantic_versioning.SemanticVersioning.from_pom_string(
+            self.pom)
+        self.assertEqual("1.2.3", semver.get_version())
+        semver.update_version(self.major_1)
+        self.assertEqual("2.0.0", semver.get_version())
+    
+    def test_version_parse(self):
+        version = semantic_versioning.Version.parse("1.2.3-rc.1+build.5")
+        self.assertEqual((version.major, version.minor, version.patch), 
+                         (1, 2, 3))
+        self.assertEqual(version.prerelease, "rc.1")
+        self.assertEqual(version.build, "build.5")
+        self.assertEqual(str(version), "1.2.3-rc.1+build.5")
+        # parsed strings are cached
+        self.assertIs(version, 
+                      semantic_versioning.Version.parse("1.2.3-rc.1+build.5"))
+    
+    def test_version_parse_invalid(self):
+        for version in ["", "1.2", "1.2.3.4", "01.2.3", "ffygxffd.g54s,"]:
+            self.assertRaises(ValueError, 
+                              semantic_versioning.Version.parse, version)
+    
+    def test_version_precedence(self):
+        # example from https://semver.org/#spec-item-11
+        versions = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-alpha.beta", 
+                    "1.0.0-beta", "1.0.0-beta.2", "1.0.0-beta.11", 
+                    "1.0.0-rc.1", "1.0.0", "1.0.1", "1.1.0", "2.0.0"]
+        parsed = [semantic_versioning.Version.parse(version) 
+                  for version in reversed(versions)]
+        self.assertListEqual([str(version) for version in sorted(parsed)], 
+                             versions)
+    
+    def test_version_hash_ignores_build(self):
+        version = semantic_versioning.Version.parse("1.0.0+a")
+        self.assertEqual(version, semantic_versioning.Version.parse("1.0.0"))
+        self.assertEqual(len({version, 
+                              semantic_versioning.Version(1, 0, 0)}), 1)
+        self.assertRaises(AttributeError, setattr, version, "major", 2)
+    
+    def check_version_array(self, use_numpy):
+        versions = semantic_versioning.VersionArray.parse(
+            ["1.0.0", "2.0.0-rc.1", "1.10.0", "1.2.0", "2.0.0", "1.0.0-beta"],
+            use_numpy=use_numpy)
+        self.assertListEqual(
+            versions.sort().to_strings(), 
+            ["1.0.0-beta", "1.0.0", "1.2.0", "1.10.0", "2.0.0-rc.1", "2.0.0"])
+        self.assertEqual(str(versions.max()), "2.0.0")
+        # latest version compatible with 1.x
+        self.assertEqual(
+            str(versions.filter_range("1.0.0", "2.0.0-0").max()), "1.10.0")
+        self.assertListEqual(
+            versions.filter_range(lower="2.0.0-rc.0").to_strings(), 
+            ["2.0.0-rc.1", "2.0.0"])
+        # the ranks of the taken versions stay comparable
+        taken = versions.take([1, 5])
+        self.assertEqual(str(taken.max()), "2.0.0-rc.1")
+        self.assertListEqual(
+            taken.filter_range(lower="1.0.0-alpha").to_strings(), 
+            ["2.0.0-rc.1", "1.0.0-beta"])
+        self.assertListEqual(
+            versions.bump("minor").to_strings(), 
+            ["1.1.0", "2.1.0", "1.11.0", "1.3.0", "2.1.0", "1.1.0"])
+        self.assertRaises(ValueError, versions.bump, self.patch + "x")
+    
+    def test_version_array(self):
+        self.check_version_array(use_numpy=False)
+    
+    @unittest.skipUnless(semantic_versioning._load_numpy(), 
+                         "numpy is not installed")
+    def test_version_array_numpy(self):
+        self.check_version_array(use_numpy=True)
+    
+    # the classification path must stay cheap to import (commit-msg hook)
+    def test_classification_import_time(self):
+        code = ("import semver.maven_semantic_versioning as semver\n"
+                "semver.SemanticVersioning().classifier.classify('fix(a): b')")
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], 
+            capture_output=True, text=True, check=True).stderr
+        imported = {}
+        for line in output.splitlines()[1:]:
+            # import time: self [us] | cumulative | imported package
+            self_time, cumulative, name = line.split(":", 1)[1].split("|")
+            imported[name.strip()] = int(self_time)
+        for heavy in ["git", "xml.etree.ElementTree", "asyncio", 
+                      "concurrent.futures", "socketserver", "subprocess", 
+                      "argparse", "numpy"]:
+            self.assertNotIn(heavy, imported)
+        # everything but the module itself, which may be compiled first
+        dependencies = sum(self_time for name, self_time in imported.items() 
+                           if name != "semver.maven_semantic_versioning")
+        self.assertLess(dependencies, 100000)
+    
     # sees if the version number matches the Semver format    
     def test_get_version(self):
         self.assertTrue(re.match(r"[0-9]+\.[0-9]+\.[0-9]+",
@@ -175,6 +326,73 @@ class TestMavenSemanticVersioning(unittest.TestCase):
             version_type=self.semver.patch)
         self.semver.set_version(original_version)
         
+    def test_find_pom_version(self):
+        start, end = semantic_versioning.find_pom_version(self.pom)
+        self.assertEqual(self.pom[start:end], b"1.2.3")
+    
+    def test_find_pom_version_missing(self):
+        self.assertIsNone(semantic_versioning.find_pom_version(
+            b"<project><parent><version>1</version></parent></project>"))
+    
+    def test_write_pom_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pom_path = os.path.join(tmp, "pom.xml")
+            with open(pom_path, "wb") as file:
+                file.write(self.pom)
+            # same length is patched in place, a longer version moves the tail
+            for version in ["2.0.0", "10.0.0-SNAPSHOT"]:
+                semantic_versioning.write_pom_version(pom_path, version)
+                with open(pom_path, "rb") as file:
+                    self.assertEqual(file.read(), self.pom.replace(
+                        b">1.2.3<", b">" + version.encode() + b"<"))
+                semantic_versioning.write_pom_version(pom_path, "1.2.3")
+    
+    def test_set_version_inplace(self):
+        original_version = self.semver.get_version()
+        self.semver.write_mode = "inplace"
+        self.semver.set_version("1.0.0")
+        self.assertEqual("1.0.0", self.semver.get_version())
+        self.assertEqual("1.0.0", semantic_versioning.SemanticVersioning(
+            ).get_version())
+        self.semver.set_version(original_version)
+        # the pom is never parsed into a tree
+        self.assertNotIn("tree", self.semver.__dict__)
+    
+    def test_update_reactor_versions(self):
+        poms = {
+            "pom.xml": "<project><groupId>g</groupId><artifactId>root"
+                "</artifactId><version>1.0.0</version><modules><module>a"
+                "</module><module>b</module></modules></project>",
+            "a/pom.xml": "<project><parent><groupId>g</groupId><artifactId>"
+                "root</artifactId><version>1.0.0</version></parent>"
+                "<artifactId>a</artifactId></project>",
+            "b/pom.xml": "<project><parent><groupId>g</groupId><artifactId>"
+                "root</artifactId><version>1.0.0</version></parent>"
+                "<artifactId>b</artifactId><dependencies><dependency>"
+                "<groupId>g</groupId><artifactId>a</artifactId><version>"
+                "1.0.0</version></dependency><dependency><groupId>other"
+                "</groupId><artifactId>a</artifactId><version>1.0.0"
+                "</version></dependency></dependencies></project>",
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content in poms.items():
+                os.makedirs(os.path.dirname(os.path.join(tmp, name)), 
+                            exist_ok=True)
+                with open(os.path.join(tmp, name), "w") as file:
+                    file.write(content)
+            changed = semantic_versioning.update_reactor_versions(
+                os.path.join(tmp, "pom.xml"), "1.1.0", workers=2)
+            self.assertEqual(len(changed), 3)
+            for name, content in poms.items():
+                with open(os.path.join(tmp, name)) as file:
+                    expected = content.replace("1.0.0", "1.1.0")
+                    if(name == "b/pom.xml"):
+                        # dependencies outside of the reactor stay untouched
+                        expected = expected[:expected.rindex("1.1.0")] + (
+                            "1.0.0</version></dependency></dependencies>"
+                            "</project>")
+                    self.assertEqual(file.read(), expected)
+    
     # should never contain a skip ci commit
     def test_get_commits_til_tag(self):
         # if used properly it should always contain an empty list
@@ -183,7 +401,144 @@ class TestMavenSemanticVersioning(unittest.TestCase):
         # to test this well look wether the [skip ci] flag is 
         for commit in commits:
             self.assertNotIn("[skip semVer]", commit)
+    
+    def test_iter_commits_til_tag_is_lazy(self):
+        commits = self.semver.iter_commits_til_tag()
+        # a generator is returned, no commit is read yet
+        self.assertFalse(isinstance(commits, list))
+        for commit in commits:
+            self.assertNotIn("[skip semVer]", commit)
+    
+    def test_iter_commits_til_tag_max_depth(self):
+        commits = list(self.semver.iter_commits_til_tag(max_depth=1))
+        self.assertLessEqual(len(commits), 1)
+    
+    def test_analyze_git_commits_generator(self):
+        self.assertListEqual(
+            self.semver.analyze_git_commits(iter(self.minor_1)), 
+            self.minor_1_keywords
+        )
             
+    def test_iter_history_backends_match(self):
+        history = list(self.semver.iter_history())
+        self.semver.history_backend = "log"
+        self.assertListEqual(list(self.semver.iter_history()), history)
+    
+    def test_iter_history_unknown_backend(self):
+        self.semver.history_backend = "svn"
+        self.assertRaises(ValueError, list, self.semver.iter_history())
+    
+    def test_iter_log_records(self):
+        stream = io.BytesIO(
+            b"a" * 40 + b"\0fix(x): y\n\0\n" + b"b" * 40 + b"\0minor\0\n")
+        # tiny chunks, so records are split across multiple reads
+        self.assertListEqual(
+            list(semantic_versioning.iter_log_records(stream, chunk_size=3)),
+            [("a" * 40, "fix(x): y\n"), ("b" * 40, "minor")]
+        )
+    
+    def test_get_version_types_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            expected = self.semver.analyze_git_commits(
+                self.semver.get_commits_til_tag())
+            first = self.semver.get_version_types_cached(cache)
+            # the rerun only uses the summary of the cached head
+            second = self.semver.get_version_types_cached(cache)
+            self.assertListEqual(first, expected)
+            self.assertEqual(
+                self.semver.get_highest_version_type(second), 
+                self.semver.get_highest_version_type(expected))
+            self.assertEqual(cache.head, self.semver.main.commit.hexsha)
+    
+    def test_get_version_types_cached_rewritten_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            self.semver.get_version_types_cached(cache)
+            # pretend the cached head was removed by a force-push
+            cache.head = "0" * 40
+            cache.highest = self.major
+            cache.save()
+            self.assertListEqual(
+                self.semver.get_version_types_cached(cache), 
+                self.semver.analyze_git_commits(
+                    self.semver.get_commits_til_tag()))
+    
+    def test_get_version_types_cached_merge(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]"])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            # the feature commit is older than the cached head
+            subprocess.run(git + ["checkout", "-q", "-b", "feature"], 
+                           check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.major_3[0]], check=True, 
+                           env={**os.environ, 
+                                "GIT_AUTHOR_DATE": "2020-01-01T00:00:00", 
+                                "GIT_COMMITTER_DATE": "2020-01-01T00:00:00"})
+            subprocess.run(git + ["checkout", "-q", "main"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.patch_3[0]], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            self.assertListEqual(semver.get_version_types_cached(cache), 
+                                 [self.patch])
+            subprocess.run(git + ["merge", "-q", "--no-ff", "-m", "merge", 
+                                  "feature"], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            self.assertEqual(semver.get_highest_version_type(
+                semver.get_version_types_cached(cache)), self.major)
+    
+    def test_get_version_types_cached_bounded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.major_3[0], 
+                              self.patch_3[0]])
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            self.assertListEqual(
+                semver.get_version_types_cached(cache, max_depth=1), 
+                [self.patch])
+            # the bounded run must not summarize the whole release
+            self.assertListEqual(semver.get_version_types_cached(cache), 
+                                 semver.get_version_types())
+    
+    def test_scan_cache_eviction(self):
+        cache = semantic_versioning.ScanCache("unused", max_entries=2)
+        cache.add("a", [self.patch])
+        cache.add("b", [self.minor])
+        cache.add("c", None)
+        self.assertListEqual(list(cache.commits), ["b", "c"])
+            
+    def test_instrumentation(self):
+        events = []
+        self.semver.instrumentation = semantic_versioning.Instrumentation(
+            callback=lambda *event: events.append(event), profile=True)
+        self.semver.reload_pom()
+        original_version = self.semver.get_version()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            commits = self.semver.get_commits_til_tag()
+            self.semver.analyze_git_commits(self.squashed_commits)
+        self.semver.set_version(original_version)
+        # per commit output is logged, not printed
+        self.assertEqual(output.getvalue(), "")
+        instrumentation = self.semver.instrumentation
+        self.assertEqual(instrumentation.counters["matches_found"], 5)
+        self.assertGreaterEqual(instrumentation.counters["commits_scanned"], 
+                                len(commits))
+        self.assertGreater(instrumentation.counters["bytes_parsed"], 0)
+        for stage in ["history", "classify", "pom_parse", "pom_write"]:
+            self.assertEqual(instrumentation.timings[stage]["calls"], 1)
+        self.assertIn(("count", "matches_found", 5), events)
+        with tempfile.TemporaryDirectory() as tmp:
+            instrumentation.export_json(os.path.join(tmp, "stages.json"))
+            with open(os.path.join(tmp, "stages.json")) as file:
+                self.assertEqual(json.load(file)["counters"], 
+                                 instrumentation.counters)
+            instrumentation.dump_profile(os.path.join(tmp, "stages.prof"))
+            pstats.Stats(os.path.join(tmp, "stages.prof"))
+    
     def test_analyze_git_commits_no_match(self):
         self.assertListEqual(
             self.semver.analyze_git_commits(self.missing_keyword), 
@@ -328,6 +683,699 @@ class TestMavenSemanticVersioning(unittest.TestCase):
             self.major
         )    
     
+
+    
+    def test_classifier_highest(self):
+        classifier = self.semver.classifier
+        self.assertEqual(classifier.highest(self.minor_1), self.minor)
+        self.assertEqual(classifier.highest(self.squashed_commits), self.major)
+        self.assertIsNone(classifier.highest(self.missing_keyword))
+    
+    def test_classifier_highest_stops_at_major(self):
+        def messages():
+            yield f"{self.major}(test): test"
+            # never reached, major can not be outranked
+            raise AssertionError("classifier did not stop at major")
+        self.assertEqual(self.semver.classifier.highest(messages()), 
+                         self.major)
+    
+    def test_classifier_count(self):
+        self.assertDictEqual(
+            self.semver.classifier.count(self.major_1 + self.missing_keyword),
+            {self.major: 1, self.minor: 1, self.patch: 1, None: 1}
+        )
+    
+    def test_classifier_stream_matches_regex(self):
+        messages = (self.squashed_commits + self.patch_1 + self.minor_1 
+                    + self.major_1 + self.missing_keyword 
+                    + [f"{self.patch}(a): b): c\n{self.minor}(x y\n"])
+        for classifier in [self.semver.classifier, 
+                           semantic_versioning.KeywordClassifier(
+                               self.major, self.minor, self.patch, 
+                               {"feat": self.minor}, conventional=True)]:
+            for message in messages + ["feat: a\nBREAKING CHANGE: b"]:
+                expected = classifier.highest((message,))
+                for size in [1, 3, 1000]:
+                    self.assertEqual(classifier.highest_of(
+                        classifier.iter_stream_types(
+                            semantic_versioning.iter_slices(message, size))), 
+                        expected)
+    
+    def test_classifier_stream_is_linear(self):
+        classifier = self.semver.classifier
+        # quadratic for the backtracking pattern
+        message = f"{self.patch}(" * 100000
+        self.assertTrue(semantic_versioning.needs_stream_scan(message))
+        self.assertIsNone(classifier.classify(message))
+        self.assertEqual(classifier.classify(message + "):x"), self.patch)
+        # far below 64 KB, e.g. in the commit-msg hook
+        message = f"{self.patch}(" * 16300
+        self.assertTrue(semantic_versioning.needs_stream_scan(message))
+        self.assertRaises(semantic_versioning.MissingKeywordException, 
+                          self.semver.validate_commit_message, message)
+        # usual messages keep the faster regex, even if they are long
+        self.assertFalse(semantic_versioning.needs_stream_scan(
+            "\n".join(self.squashed_commits) * 100))
+    
+    def test_classifier_stream_stops_at_major(self):
+        read = []
+        
+        def chunks():
+            for index in range(1000):
+                read.append(index)
+                yield f"* {self.patch}(a): b\n" * 10
+                if(index == 5):
+                    yield f"* {self.major}(a): b\n"
+        
+        classifier = self.semver.classifier
+        self.assertEqual(
+            classifier.highest_of(classifier.iter_stream_types(chunks())), 
+            self.major)
+        self.assertLess(len(read), 10)
+    
+    def test_classify_commit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["squash\n\n" + "lock line\n" * 10000 
+                              + self.minor_2[0]])
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            self.assertEqual(semver.classify_commit(chunk_size=4096), 
+                             self.minor)
+    
+    def test_classifier_rebuilt_on_keyword_change(self):
+        self.semver.patch = "patch"
+        self.assertListEqual(
+            self.semver.analyze_git_commits(["patch(x): y", "fix(x): y"]),
+            ["patch"]
+        )
+
+    
+    def test_bump_repositories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = os.path.join(tmp, "first")
+            second = os.path.join(tmp, "second")
+            broken = os.path.join(tmp, "broken")
+            create_repo(first, ["init [skip semVer]"] + self.minor_1)
+            create_repo(second, self.major_1 + ["init [skip semVer]"] 
+                        + self.patch_3, version="2.3.4")
+            os.makedirs(broken)
+            results = semantic_versioning.bump_repositories(
+                [first, second, broken], workers=2)
+            self.assertEqual(results[0].new_version, "1.1.0")
+            self.assertEqual(results[0].bump_type, self.minor)
+            self.assertEqual(len(results[0].commits), 3)
+            self.assertEqual(results[1].old_version, "2.3.4")
+            self.assertEqual(results[1].new_version, "2.3.5")
+            self.assertIsNone(results[1].error)
+            # a broken repo is reported, but doesn't stop the others
+            self.assertIsNotNone(results[2].error)
+    
+    def test_release_async(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # a local bare repo stands in for the remote
+            remote = os.path.join(tmp, "remote.git")
+            local = os.path.join(tmp, "local")
+            other = os.path.join(tmp, "other")
+            create_repo(os.path.join(tmp, "seed"), 
+                        ["init [skip semVer]", "fix(a): b"])
+            subprocess.run(["git", "clone", "-q", "--bare", 
+                            os.path.join(tmp, "seed"), remote], check=True)
+            for clone in [local, other]:
+                subprocess.run(["git", "clone", "-q", remote, clone], 
+                               check=True)
+                for key, value in [("user.name", "test"), 
+                                   ("user.email", "test@test")]:
+                    subprocess.run(["git", "-C", clone, "config", key, value], 
+                                   check=True)
+            # pushed by someone else, only known after the fetch
+            subprocess.run(["git", "-C", other, "commit", "-q", 
+                            "--allow-empty", "-m", self.minor_2[0]], 
+                           check=True)
+            subprocess.run(["git", "-C", other, "push", "-q"], check=True)
+            result = asyncio.run(
+                semantic_versioning.SemanticVersioning(local).release_async())
+            self.assertEqual(result.bump_type, self.minor)
+            self.assertEqual(result.new_version, "1.1.0")
+            self.assertEqual(len(result.commits), 2)
+            pushed = subprocess.run(
+                ["git", "-C", remote, "log", "-1", "--format=%B", "main"], 
+                capture_output=True, text=True, check=True).stdout
+            self.assertIn("[skip semVer]", pushed)
+            pom = subprocess.run(
+                ["git", "-C", remote, "show", "main:pom.xml"], 
+                capture_output=True, text=True, check=True).stdout
+            self.assertIn("<version>1.1.0</version>", pom)
+            # only main is fast-forwarded and released
+            subprocess.run(["git", "-C", local, "checkout", "-q", "-b", 
+                            "feature"], check=True)
+            semver = semantic_versioning.SemanticVersioning(local)
+            with self.assertRaises(RuntimeError):
+                asyncio.run(semver.release_async())
+    
+    def test_versioning_daemon(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "repo")
+            create_repo(path, ["init [skip semVer]", self.patch_3[0]])
+            socket_path = os.path.join(tmp, "daemon.sock")
+            server = semantic_versioning.VersioningDaemon().create_server(
+                socket_path)
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                response = semantic_versioning.daemon_request(
+                    socket_path, "next_version", path)
+                self.assertEqual(response["next_version"], "1.0.1")
+                # new commits are picked up incrementally
+                subprocess.run(["git", "-C", path, "-c", "user.name=test", 
+                                "-c", "user.email=test@test", "commit", "-q", 
+                                "--allow-empty", "-m", self.major_3[0]], 
+                               check=True)
+                response = semantic_versioning.daemon_request(
+                    socket_path, "apply_bump", path)
+                self.assertEqual(response["next_version"], "2.0.0")
+                self.assertEqual(semantic_versioning.SemanticVersioning(
+                    path).get_version(), "2.0.0")
+                # the bump is used up until new commits arrive
+                response = semantic_versioning.daemon_request(
+                    socket_path, "next_version", path)
+                self.assertFalse(response["ok"])
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+    
+    def test_versioning_daemon_eviction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            daemon = semantic_versioning.VersioningDaemon(max_repositories=1)
+            for name in ["first", "second"]:
+                create_repo(os.path.join(tmp, name), [self.minor_2[0]])
+                daemon.next_version(os.path.join(tmp, name))
+            self.assertListEqual(
+                list(daemon.repositories), 
+                [os.path.realpath(os.path.join(tmp, "second"))])
+    
+    def test_read_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = os.path.join(tmp, "repos.txt")
+            with open(manifest, "w") as file:
+                file.write("# services\nfirst\n\n  second  \n")
+            self.assertListEqual(
+                semantic_versioning.read_manifest(manifest), 
+                [os.path.join(tmp, "first"), os.path.join(tmp, "second")])
+
+    
+    def test_graph_walk_across_merges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]"])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            subprocess.run(git + ["checkout", "-q", "-b", "feature"], 
+                           check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.minor_2[0]], check=True)
+            subprocess.run(git + ["checkout", "-q", "main"], check=True)
+            for message in self.patch_3 + ["release [skip semVer]"]:
+                subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                      message], check=True)
+            subprocess.run(git + ["merge", "-q", "--no-ff", "-m", "merge", 
+                                  "feature"], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            release = semver.find_release_point()
+            self.assertEqual(semver.repo.commit(release).message.strip(), 
+                             "release [skip semVer]")
+            # the feature commit is older than the release, but not released
+            self.assertListEqual(list(semver.iter_commits_since_release()), 
+                                 ["merge\n", self.minor_2[0] + "\n"])
+            semver.write_commit_graph()
+            self.assertTrue(os.path.exists(os.path.join(
+                tmp, ".git", "objects", "info", "commit-graph")))
+    
+    def test_graph_walk_release_branch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.major_3[0]])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            subprocess.run(git + ["checkout", "-q", "-b", "release/1.x", 
+                                  "HEAD~1"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.patch_3[0]], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            semver.branch = "release/1.x"
+            semver.graph_walk = True
+            self.assertListEqual(semver.get_commits_til_tag(), 
+                                 [self.patch_3[0] + "\n"])
+    
+    def test_tag_anchors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init", self.major_3[0]])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            subprocess.run(git + ["tag", "-a", "-m", "release", "v1.4.2"], 
+                           check=True)
+            subprocess.run(git + ["tag", "v1.3.0", "HEAD~1"], check=True)
+            subprocess.run(git + ["tag", "v2-beta"], check=True)
+            # tags of other branches are no release of main
+            subprocess.run(git + ["checkout", "-q", "-b", "other"], 
+                           check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  "other"], check=True)
+            subprocess.run(git + ["tag", "v9.0.0"], check=True)
+            subprocess.run(git + ["checkout", "-q", "main"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.minor_2[0]], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            self.assertEqual(len(semver.read_tag_index()), 3)
+            semver.tag_anchors = True
+            self.assertEqual(str(semver.release_tag[1]), "1.4.2")
+            self.assertEqual(semver.get_release_version(), "1.4.2")
+            commits = semver.get_commits_til_tag()
+            self.assertListEqual(commits, [self.minor_2[0] + "\n"])
+            semver.update_version(commits)
+            self.assertEqual(semver.get_version(), "1.5.0")
+    
+    def test_tag_anchors_cache_and_notes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.major_3[0]])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            subprocess.run(git + ["tag", "v2.0.0"], check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.patch_3[0]], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            semver.tag_anchors = True
+            # the released major commit is not counted again
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            self.assertListEqual(semver.get_version_types_cached(cache), 
+                                 [self.patch])
+            self.assertListEqual(semver.get_version_types_from_notes(), 
+                                 [self.patch])
+    
+    def test_tag_anchors_fallback_to_pom(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, [self.patch_3[0]], version="2.0.0")
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            semver.tag_anchors = True
+            self.assertIsNone(semver.release_tag)
+            self.assertEqual(semver.get_release_version(), "2.0.0")
+    
+    def test_changelog_markdown(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "CHANGELOG.md")
+            changelog = semantic_versioning.Changelog(self.semver.classifier)
+            changelog.add(self.squashed_commits)
+            changelog.add([self.major_3[0], "no keyword"])
+            changelog.write(path, "2.0.0", date="2022-05-01")
+            changelog = semantic_versioning.Changelog(self.semver.classifier)
+            changelog.add(self.patch_3)
+            changelog.write(path, "2.0.1", date="2022-05-02")
+            with open(path) as file:
+                content = file.read()
+            self.assertTrue(content.startswith(
+                "## 2.0.0 (2022-05-01)\n\n### Breaking Changes\n\n"
+                "- **restructure:** code restructured\n"
+                "- **minor:** test\n"))
+            self.assertIn("### Fixes", content)
+            # the second release is appended after the first
+            self.assertTrue(content.endswith(
+                "\n\n## 2.0.1 (2022-05-02)\n\n### Fixes\n\n"
+                "- **test:** test\n"))
+    
+    def test_changelog_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "CHANGELOG.jsonl")
+            create_repo(tmp, ["init [skip semVer]"] + self.minor_2
+                        + self.patch_3)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            semver.update_version(semver.get_commits_til_tag())
+            changelog = semver.write_changelog(path, format="json")
+            self.assertEqual(len(changelog), 2)
+            with open(path) as file:
+                entries = [json.loads(line) for line in file]
+            self.assertEqual(entries[0]["version"], "1.1.0")
+            self.assertEqual(entries[0]["type"], self.minor)
+    
+    def test_package_release(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = os.path.join(tmp, "target")
+            os.makedirs(target)
+            artifacts = {"app-1.2.0.jar": b"jar" * 1000, 
+                         "app-1.2.0-dist.zip": b"zip", 
+                         "app-1.2.0-empty.jar": b"", 
+                         "app-1.1.0.jar": b"old", "app-1.2.0.pom": b"pom"}
+            for name, content in artifacts.items():
+                with open(os.path.join(target, name), "wb") as file:
+                    file.write(content)
+            manifest = semantic_versioning.package_release(tmp, "1.2.0")
+            names = [artifact["name"] for artifact in manifest["artifacts"]]
+            self.assertListEqual(names, ["app-1.2.0-dist.zip", 
+                                         "app-1.2.0-empty.jar", 
+                                         "app-1.2.0.jar"])
+            release = os.path.join(tmp, "release", "1.2.0")
+            for artifact in manifest["artifacts"]:
+                with open(os.path.join(release, artifact["name"]), 
+                          "rb") as file:
+                    self.assertEqual(file.read(), artifacts[artifact["name"]])
+                self.assertEqual(
+                    artifact["sha256"], 
+                    hashlib.sha256(artifacts[artifact["name"]]).hexdigest())
+            with open(os.path.join(release, "manifest.json")) as file:
+                self.assertEqual(json.load(file), manifest)
+    
+    def test_classifier_aliases_and_conventional_commits(self):
+        classifier = semantic_versioning.KeywordClassifier(
+            self.major, self.minor, self.patch, 
+            {"feat": self.minor, "perf": self.patch}, conventional=True)
+        self.assertListEqual(
+            list(classifier.iter_version_types([
+                "feat: add endpoint", "perf(db): faster", 
+                f"{self.patch}(api)!: drop v1", 
+                "chore: cleanup\n\nBREAKING CHANGE: removed the cli"])),
+            [self.minor, self.patch, self.major, self.major])
+        self.assertListEqual(
+            list(classifier.iter_entries(["feat: add endpoint"])), 
+            [(self.minor, None, "add endpoint")])
+        # the type has to start the line
+        for message in ["chore: bump deps\n\nsee the major: change", 
+                        "docs: explain the prefix: option", 
+                        "refactor: use defeat: strategy"]:
+            self.assertIsNone(classifier.classify(message))
+            self.assertIsNone(classifier.highest_of(
+                classifier.iter_stream_types([message])))
+        # the legacy classifier only knows its keywords with a scope
+        self.assertIsNone(self.semver.classifier.classify(
+            f"{self.patch}: no scope\nfeat(x): y"))
+    
+    def test_load_policy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, [], version="1.2.0")
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            self.assertFalse(semver.load_policy())
+            with open(os.path.join(tmp, ".semver.json"), "w") as file:
+                json.dump({"minor": ["feature", "feat"], 
+                           "channels": {"develop": "beta"}}, file)
+            self.assertTrue(semver.load_policy())
+            self.assertEqual(semver.classifier.classify("feat(a): b"), 
+                             "feature")
+            self.assertListEqual(
+                semver.analyze_git_commits([self.patch_3[0]]), [self.patch])
+            self.assertEqual(semver.compute_next_version("1.2.0", "feature"), 
+                             "1.3.0")
+            semver.branch = "develop"
+            for version, version_type, expected in [
+                    ("1.2.0", "feature", "1.3.0-beta.1"), 
+                    ("1.3.0-beta.1", self.patch, "1.3.0-beta.2"), 
+                    ("1.3.0-beta.2", self.major, "2.0.0-beta.1"), 
+                    ("1.3.0-SNAPSHOT", self.patch, "1.3.0-beta.1")]:
+                self.assertEqual(
+                    semver.compute_next_version(version, version_type), 
+                    expected)
+            for policy in [{"unknown": True}, 
+                           {"paths": [{"paths": ["*"], "bump": "nope"}]}]:
+                with open(os.path.join(tmp, ".semver.json"), "w") as file:
+                    json.dump(policy, file)
+                with self.assertRaises(ValueError):
+                    semver.load_policy()
+    
+    def test_path_rules(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]"])
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            for path, message in [("docs/guide.md", self.major_3[0]), 
+                                  ("src/test/a.java", self.minor_2[0]), 
+                                  ("src/main/a.java", self.patch_3[0])]:
+                os.makedirs(os.path.join(tmp, os.path.dirname(path)), 
+                            exist_ok=True)
+                with open(os.path.join(tmp, path), "w") as file:
+                    file.write(path)
+                subprocess.run(git + ["add", path], check=True)
+                subprocess.run(git + ["commit", "-q", "-m", message], 
+                               check=True)
+            with open(os.path.join(tmp, ".semver.json"), "w") as file:
+                json.dump({"paths": [
+                    {"paths": ["docs/*"], "bump": None}, 
+                    {"paths": ["src/test/*"], "bump": self.patch}]}, file)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            semver.load_policy()
+            self.assertListEqual(semver.get_version_types(), 
+                                 [self.patch, self.patch])
+            # every mode applies the path rules the same way
+            cache = semantic_versioning.ScanCache(os.path.join(tmp, "cache"))
+            self.assertListEqual(semver.get_version_types_cached(cache), 
+                                 [self.patch, self.patch])
+            self.assertListEqual(semver.get_version_types_from_notes(), 
+                                 [self.patch, self.patch])
+            # the release notes follow the path rules, too
+            changelog = semver.write_changelog(
+                os.path.join(tmp, "CHANGELOG.md"))
+            self.assertEqual(len(changelog.entries[self.major]), 0)
+            self.assertEqual(len(changelog.entries[self.minor]), 0)
+            self.assertEqual(len(changelog), 2)
+            daemon = semantic_versioning.VersioningDaemon()
+            self.assertEqual(daemon.next_version(tmp)["bump_type"], 
+                             self.patch)
+            result = semantic_versioning.bump_repository(tmp)
+            self.assertEqual(result.bump_type, self.patch)
+            self.assertEqual(result.new_version, "1.0.1")
+    
+    def test_plan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.patch_3[0]], 
+                        version="1.2.3")
+            git = ["git", "-C", tmp, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            for branch, message in [("pr-minor", self.minor_2[0]), 
+                                    ("pr-major", self.major_3[0]), 
+                                    ("pr-none", "no keyword")]:
+                subprocess.run(git + ["branch", branch, "main"], check=True)
+                subprocess.run(git + ["checkout", "-q", branch], check=True)
+                subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                      message], check=True)
+            subprocess.run(git + ["checkout", "-q", "main"], check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            plan = semver.plan()
+            self.assertEqual(plan.old_version, "1.2.3")
+            self.assertEqual(plan.new_version, "1.2.4")
+            self.assertEqual(len(plan.commits), 1)
+            plan = semver.plan("main..pr-none")
+            self.assertIsNone(plan.bump_type)
+            self.assertEqual(plan.new_version, "1.2.3")
+            # many plans share one repository
+            plans = semantic_versioning.plan_versions(
+                tmp, ["main..pr-minor", "main..pr-major"] * 10, workers=8)
+            self.assertListEqual(
+                [plan.new_version for plan in plans], ["1.3.0", "2.0.0"] * 10)
+            self.assertEqual(plans[0].bump_type, self.minor)
+            # nothing was written
+            status = subprocess.run(git + ["status", "--porcelain"], 
+                                    capture_output=True, text=True, 
+                                    check=True).stdout
+            self.assertEqual(status, "")
+    
+    def test_backfill_versions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = os.path.join(tmp, "repo")
+            create_repo(repo, ["init", self.patch_3[0], "bump [skip semVer]", 
+                               self.minor_2[0], self.major_3[0], 
+                               "bump [skip semVer]", self.patch_3[0]])
+            output = os.path.join(tmp, "versions.csv")
+            self.assertEqual(semantic_versioning.backfill_versions(
+                repo, output, workers=2, chunk_size=2), 7)
+            with open(output, newline="") as file:
+                rows = list(csv.reader(file))
+            self.assertListEqual(rows[0], ["sha", "version_type", "version", 
+                                           "released"])
+            self.assertListEqual(
+                [row[1:] for row in rows[1:]], 
+                [["", "1.0.1", "1"], [self.patch, "1.0.1", "1"], 
+                 ["", "1.0.1", "1"], [self.minor, "2.0.0", "1"], 
+                 [self.major, "2.0.0", "1"], ["", "2.0.0", "1"], 
+                 [self.patch, "2.0.1", "0"]])
+            database = os.path.join(tmp, "versions.db")
+            semantic_versioning.backfill_versions(repo, database, "sqlite", 
+                                                  workers=2)
+            connection = sqlite3.connect(database)
+            self.assertEqual(connection.execute(
+                "SELECT version FROM versions WHERE sha = ?", 
+                (rows[4][0],)).fetchone(), ("2.0.0",))
+            connection.close()
+    
+    def test_backfill_versions_merges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = os.path.join(tmp, "repo")
+            git = ["git", "-C", repo, "-c", "user.name=test", 
+                   "-c", "user.email=test@test"]
+            # the initial commit has no pom.xml yet
+            subprocess.run(["git", "init", "-q", "-b", "main", repo], 
+                           check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  "readme [skip semVer]"], check=True)
+            with open(os.path.join(repo, "pom.xml"), "w") as file:
+                file.write('<project xmlns="http://maven.apache.org/POM/'
+                           '4.0.0"><version>1.0.0</version></project>')
+            subprocess.run(git + ["add", "pom.xml"], check=True)
+            subprocess.run(git + ["commit", "-q", "-m", self.patch_3[0]], 
+                           check=True)
+            subprocess.run(git + ["checkout", "-q", "-b", "feature"], 
+                           check=True)
+            subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", 
+                                  self.major_3[0]], check=True)
+            subprocess.run(git + ["checkout", "-q", "main"], check=True)
+            subprocess.run(git + ["merge", "-q", "--no-ff", "-m", "merge", 
+                                  "feature"], check=True)
+            semver = semantic_versioning.SemanticVersioning(repo)
+            self.assertEqual(semver.bump(write=False).new_version, "2.0.0")
+            output = os.path.join(tmp, "versions.csv")
+            self.assertEqual(semantic_versioning.backfill_versions(
+                repo, output, workers=1), 4)
+            with open(output, newline="") as file:
+                rows = list(csv.reader(file))[1:]
+            # the commit of the merged branch is part of the release
+            self.assertListEqual([row[1:] for row in rows[1:]], 
+                                 [[self.patch, "2.0.0", "0"], 
+                                  [self.major, "2.0.0", "0"], 
+                                  ["", "2.0.0", "0"]])
+    
+    def test_bump_result(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]"] + self.minor_1)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                result = semver.bump()
+            self.assertEqual(stdout.getvalue(), "")
+            self.assertEqual(result.old_version, "1.0.0")
+            self.assertEqual(result.new_version, "1.1.0")
+            self.assertEqual(result.bump_type, self.minor)
+            self.assertDictEqual(dict(result.counts), 
+                                 {self.major: 0, self.minor: 1, 
+                                  self.patch: 2})
+            self.assertEqual(len(result.commits), 3)
+            self.assertEqual(result.commits[0], 
+                             semver.repo.head.commit.hexsha)
+            self.assertIn("history", result.timings)
+            self.assertTrue(result.written)
+            self.assertEqual(semver.get_version(), "1.1.0")
+            with self.assertRaises(AttributeError):
+                result.bump_type = self.major
+            with self.assertRaises(TypeError):
+                result.counts[self.major] = 1
+            self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+            self.assertEqual(json.loads(json.dumps(result.to_dict()))[
+                "new_version"], "1.1.0")
+    
+    def test_bump_result_no_keyword(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", "no keyword"])
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            result = semver.bump()
+            self.assertIsNone(result.bump_type)
+            self.assertEqual(result.new_version, "1.0.0")
+            self.assertFalse(result.written)
+    
+    def test_main_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]"] + self.major_3)
+            output = subprocess.run(
+                [sys.executable, semantic_versioning.__file__, "--json"], 
+                cwd=tmp, capture_output=True, text=True, check=True).stdout
+            result = json.loads(output)
+            self.assertEqual(result["new_version"], "2.0.0")
+            self.assertEqual(result["counts"][self.major], 1)
+    
+    def test_main_json_notes_and_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.major_3[0]])
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            # the recorded note wins over the message
+            subprocess.run(["git", "-C", tmp, "-c", "user.name=test", 
+                            "-c", "user.email=test@test", "notes", 
+                            f"--ref={semver.notes_ref}", "add", "-m", 
+                            self.minor, "HEAD"], check=True)
+            for flag, version in [("--notes", "1.1.0"), ("--cache", "2.0.0")]:
+                output = subprocess.run(
+                    [sys.executable, semantic_versioning.__file__, "--json", 
+                     flag], 
+                    cwd=tmp, capture_output=True, text=True, 
+                    check=True).stdout
+                result = json.loads(output)
+                self.assertEqual(result["new_version"], version)
+                self.assertIn("history", result["timings"])
+            self.assertTrue(os.path.exists(
+                os.path.join(tmp, ".git", "semver-cache")))
+    
+    def test_validate_commit_message(self):
+        self.assertEqual(self.semver.validate_commit_message(
+            self.minor_2[0] + "\n# fix(a): only a comment"), self.minor)
+        self.assertIsNone(self.semver.validate_commit_message(
+            "release [skip semVer]"))
+        with self.assertRaises(semantic_versioning.MissingKeywordException):
+            self.semver.validate_commit_message(
+                "no keyword\n# " + self.major_3[0])
+        # git commit -v appends the staged diff below the scissors line
+        with self.assertRaises(semantic_versioning.MissingKeywordException):
+            self.semver.validate_commit_message(
+                "no keyword\n# Please enter the commit message\n"
+                "# ------------------------ >8 ------------------------\n"
+                "# Do not modify or remove the line above.\n"
+                "diff --git a/test.py b/test.py\n"
+                f'+    message = "{self.patch_3[0]}"\n')
+    
+    def test_commit_msg_hook(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            message = os.path.join(tmp, "COMMIT_EDITMSG")
+            with open(message, "w") as file:
+                file.write(self.patch_3[0])
+            self.assertEqual(
+                semantic_versioning.main(["--commit-msg", message]), 0)
+            with open(message, "w") as file:
+                file.write("no keyword")
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(
+                    semantic_versioning.main(["--commit-msg", message]), 1)
+            self.assertIn("keywords", stderr.getvalue())
+    
+    def test_install_hooks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, [])
+            hooks_dir = os.path.join(tmp, "hooks")
+            subprocess.run(["git", "-C", tmp, "config", "core.hooksPath", 
+                            "hooks"], check=True)
+            os.makedirs(hooks_dir)
+            # e.g. the Change-Id hook of Gerrit
+            with open(os.path.join(hooks_dir, "commit-msg"), "w") as file:
+                file.write("#!/bin/sh\necho other\n")
+            self.assertRaises(FileExistsError, 
+                              semantic_versioning.install_hooks, tmp)
+            self.assertFalse(os.path.exists(
+                os.path.join(hooks_dir, "post-commit")))
+            self.assertEqual(
+                semantic_versioning.install_hooks(tmp, force=True), 
+                hooks_dir)
+            # installing again doesn't need force
+            semantic_versioning.install_hooks(tmp)
+            with open(os.path.join(hooks_dir, "commit-msg")) as file:
+                self.assertIn("--commit-msg", file.read())
+    
+    def test_version_types_from_notes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            create_repo(tmp, ["init [skip semVer]", self.patch_3[0], 
+                              "no keyword", self.minor_2[0]])
+            # notes are commits, the hook runs with the identity of the user
+            for key, value in [("user.name", "test"), 
+                               ("user.email", "test@test")]:
+                subprocess.run(["git", "-C", tmp, "config", key, value], 
+                               check=True)
+            semver = semantic_versioning.SemanticVersioning(tmp)
+            for rev in ["HEAD~2", "HEAD~1"]:
+                semver.record_bump_note(rev)
+            notes = semver.read_bump_notes()
+            self.assertEqual(len(notes), 2)
+            self.assertIn(None, notes.values())
+            # a note wins over the message, HEAD has none and is parsed
+            subprocess.run(["git", "-C", tmp, "notes", "--ref=semver", "add", 
+                            "-f", "-m", self.major, "HEAD~2"], check=True,
+                           stderr=subprocess.DEVNULL)
+            self.assertListEqual(semver.get_version_types_from_notes(), 
+                                 [self.minor, self.major])
         
     def test_update_version_no_match(self):
         self.assertRaises(